@@ -39,10 +39,14 @@ from .sprite import (
 from .events import EventManager, InteractabilityFlags
 
 from PySide6.QtWidgets import QApplication, QLabel, QWidget
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QCoreApplication, QTimer
 
 import sys
 
+# the media view imports Qt WebEngine lazily, after the app exists,
+# which needs shared OpenGL contexts switched on beforehand
+QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+
 APPLICATION = QApplication(sys.argv)
 
 class RockinWindow(QWidget):
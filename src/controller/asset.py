@@ -14,6 +14,9 @@ class AssetController:
     provides utilities for loading, listing, and randomly selecting assets from folders.
     """
 
+    # (directory, suffixes) -> (directory mtime, sorted listing), shared by all controllers
+    _listCache: dict[tuple[str, anySuffixes], tuple[int, list[Path]]] = {}
+
     def __init__(self, folder: str = "") -> None:
         """
         initialise the asset controller for a specific folder.
@@ -81,7 +84,8 @@ class AssetController:
 
     def listDirectory(self, relativePath: str = "", suffixes: anySuffixes = None) -> list[Path]:
         """
-        list all assets in a directory.
+        list all assets in a directory, sorted by path.
+        the listing is cached until the directory's mtime changes.
         
         :param relativePath: relative path within the folder
         :type relativePath: str
@@ -91,7 +95,25 @@ class AssetController:
         :rtype: list[Path]
         """
 
-        return list(self.iterateDirectory(relativePath, suffixes))
+        directory = self.getAsset(relativePath)
+        key = (str(directory), suffixes)
+
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+
+        cached = self._listCache.get(key)
+
+        if (cached is not None) and (mtime is not None) and (cached[0] == mtime):
+            return list(cached[1])
+
+        items = sorted(self.iterateDirectory(relativePath, suffixes))
+
+        if mtime is not None:
+            self._listCache[key] = (mtime, items)
+
+        return list(items)
 
     def iterateDirectory(self, relativePath: str = "", suffixes: anySuffixes = None):
         """
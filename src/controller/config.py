@@ -1,12 +1,13 @@
 from .asset import ROOT_ASSET_DIRECTORY
 
-from PySide6.QtCore import Signal, QObject
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool
 
 from platformdirs import user_config_dir
 from typing import Any, Optional
 from copy import deepcopy
 from pathlib import Path
 
+import threading
 import tempfile
 import logging
 import json
@@ -15,6 +16,9 @@ import os
 logger = logging.getLogger(__name__)
 JsonDict = dict[str, Any]
 
+# background and foreground saves must not interleave their replace steps
+_WRITE_LOCK = threading.Lock()
+
 def readJSONFile(path: Path) -> JsonDict:
     """
     read a JSON file and return its contents as a dictionary.
@@ -50,7 +54,7 @@ def atomicWriteJson(
 ) -> None:
     """
     write JSON data to a file atomically using a temporary file.
-    ensures data integrity by writing to a temporary file first, then replacing the target.
+    ensures data integrity by writing and fsyncing a temporary file first, then replacing the target.
     creates parent directories if they do not exist.
     
     :param path: the target path to write to
@@ -60,27 +64,34 @@ def atomicWriteJson(
     """
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    fileDescriptor, temporaryFile = tempfile.mkstemp(
-        prefix=path.name,
-        suffix=".tmp",
-        dir=str(path.parent)
-    )
-
-    tempFilePath = Path(temporaryFile)
-
-    try:
-        with os.fdopen(fileDescriptor, "w", encoding="utf-8") as file:
-            json.dump(
-                data,
-                file,
-                indent=4,
-                sort_keys=True
-            )
-            file.write("\n")
+    # encode up front so the locked section is a single write of ready bytes,
+    # using the platform line endings a text-mode write would have produced
+    payload = (json.dumps(
+        data,
+        indent=4,
+        sort_keys=True
+    ) + "\n").replace("\n", os.linesep).encode("utf-8")
+
+    with _WRITE_LOCK:
+        fileDescriptor, temporaryFile = tempfile.mkstemp(
+            prefix=path.name,
+            suffix=".tmp",
+            dir=str(path.parent)
+        )
+
+        tempFilePath = Path(temporaryFile)
+
+        try:
+            with os.fdopen(fileDescriptor, "wb") as file:
+                file.write(payload)
+
+                # make sure the bytes are on disk before the rename can expose them
+                file.flush()
+                os.fsync(file.fileno())
 
-        tempFilePath.replace(path)
-    finally:
-        deleteFileIfExists(tempFilePath)
+            tempFilePath.replace(path)
+        finally:
+            deleteFileIfExists(tempFilePath)
 
 def deepMerge(
     base: JsonDict,
@@ -210,6 +221,43 @@ def setByPath(
 
     current[parts[-1]] = value
 
+class _SaveTask(QRunnable):
+    """
+    writes a pruned config snapshot to disk on the save thread,
+    skipping itself if a newer save was requested in the meantime.
+    the outcome is reported back to the ui thread through a queued signal
+    """
+
+    def __init__(
+        self,
+        controller: "ConfigController",
+        sequence: int,
+        generation: int,
+        payload: JsonDict
+    ):
+        super().__init__()
+
+        self.controller = controller
+        self.sequence = sequence
+        self.generation = generation
+        self.payload = payload
+
+    def run(self) -> None:
+        if self.sequence != self.controller._saveSequence:
+            return
+
+        try:
+            atomicWriteJson(
+                self.controller.userProfilePath,
+                self.payload
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save config: {e}")
+            self.controller._saveFinished.emit(self.generation, self.payload, False)
+            return
+
+        self.controller._saveFinished.emit(self.generation, self.payload, True)
+
 class ConfigController(QObject):
     """
     manages application configuration with persistence to json.
@@ -218,6 +266,9 @@ class ConfigController(QObject):
 
     onValueChanged = Signal(str, object)
 
+    # generation, payload, whether it was written; emitted from the save thread
+    _saveFinished = Signal(int, object, bool)
+
     def __init__(self):
         """
         initialise the configuration controller and load config from disk.
@@ -235,6 +286,28 @@ class ConfigController(QObject):
         self.currentOverrides = {}
         self.config = {}
 
+        # dot-path -> value, cleared whenever the config changes
+        self._valueCache: dict[str, Any] = {}
+
+        # bumped on every change so readers can tell if they are out of date
+        self.generation = 0
+
+        # overrides as they currently sit in the profile file, only updated once a write succeeds
+        self._savedOverrides: Optional[JsonDict] = None
+
+        # generation those overrides were written at, -1 when unknown
+        self._savedGeneration = -1
+
+        # generation of the newest background save still in flight, -1 when none
+        self._queuedGeneration = -1
+
+        # background saves run one at a time, newest wins
+        self._savePool = QThreadPool(self)
+        self._savePool.setMaxThreadCount(1)
+        self._saveSequence = 0
+
+        self._saveFinished.connect(self._onSaveFinished, Qt.QueuedConnection)
+
         self.loadConfig()
 
     def loadConfig(
@@ -259,29 +332,120 @@ class ConfigController(QObject):
             logger.warning(f"Failed to load config from {profileToLoad}: {e}")
             self.currentOverrides = {}
 
+        # only our own profile file is known to hold these overrides
+        if profileToLoad == self.userProfilePath and profileToLoad.exists():
+            self._savedOverrides = deepcopy(self.currentOverrides)
+        else:
+            self._savedOverrides = None
+
+        self._savedGeneration = -1
+        self._queuedGeneration = -1
+
         self.config = deepMerge(
             self.defaults,
             self.currentOverrides
         )
 
+        self._valueCache.clear()
+        self.generation += 1
+
         logger.debug("Loaded config: %s", self.config)
         return self.config
 
-    def saveConfig(self):
+    def _prunedSnapshot(self) -> Optional[JsonDict]:
         """
-        save the current configuration to disk, omitting default values.
+        get a detached copy of the overrides to write, or None if the file is already up to date.
+        
+        :return: the pruned configuration, or None if nothing needs writing
+        :rtype: Optional[JsonDict]
         """
 
+        # nothing has been set since the last successful write, skip pruning altogether
+        if self.generation == self._savedGeneration:
+            return None
+
         pruned = pruneForDefaults(
             self.defaults,
             self.config
-        )
+        ) or {}
+
+        # the profile on disk already holds exactly this
+        if pruned == self._savedOverrides:
+            self._savedGeneration = self.generation
+            return None
+
+        return deepcopy(pruned)
+
+    def saveConfig(self):
+        """
+        save the current configuration to disk, omitting default values.
+        waits for any background save first so an older snapshot cannot land last.
+        """
+
+        self._savePool.waitForDone()
+
+        generation = self.generation
+        snapshot = self._prunedSnapshot()
+
+        if snapshot is None:
+            return
 
         atomicWriteJson(
             self.userProfilePath,
-            pruned or {}
+            snapshot
+        )
+
+        self._savedOverrides = snapshot
+        self._savedGeneration = generation
+
+    def saveConfigAsync(self):
+        """
+        save the current configuration on a background thread, omitting default values.
+        the snapshot is taken now, only the serialisation and disk write happen off the ui thread.
+        """
+
+        # this exact state is already on its way to disk
+        if self.generation == self._queuedGeneration:
+            return
+
+        snapshot = self._prunedSnapshot()
+
+        if snapshot is None:
+            return
+
+        self._saveSequence += 1
+        self._queuedGeneration = self.generation
+
+        self._savePool.start(
+            _SaveTask(self, self._saveSequence, self.generation, snapshot)
         )
 
+    def _onSaveFinished(self, generation: int, payload: JsonDict, written: bool) -> None:
+        """
+        record the outcome of a background save on the ui thread.
+        
+        :param generation: the config generation the payload was taken at
+        :type generation: int
+        :param payload: the pruned configuration the save tried to write
+        :type payload: JsonDict
+        :param written: whether the payload reached the disk
+        :type written: bool
+        """
+
+        if generation == self._queuedGeneration:
+            self._queuedGeneration = -1
+
+        if not written:
+            # the file no longer matches what we think is on disk
+            self._savedOverrides = None
+            self._savedGeneration = -1
+            return
+
+        # a later synchronous save may already have landed
+        if generation > self._savedGeneration:
+            self._savedOverrides = payload
+            self._savedGeneration = generation
+
     def getValue(self, path: str) -> Any:
         """
         get a configuration value by dot-separated path.
@@ -292,7 +456,35 @@ class ConfigController(QObject):
         :rtype: Any
         """
 
-        return getByPath(self.config, path)
+        try:
+            return self._valueCache[path]
+        except KeyError:
+            pass
+
+        value = getByPath(self.config, path)
+        self._valueCache[path] = value
+
+        return value
+
+    def getValues(self, paths: list[str]) -> dict[str, Any]:
+        """
+        get several configuration values at once, skipping paths that do not exist.
+        
+        :param paths: the config paths to look up
+        :type paths: list[str]
+        :return: a mapping of each found path to its value
+        :rtype: dict[str, Any]
+        """
+
+        values = {}
+
+        for path in paths:
+            try:
+                values[path] = self.getValue(path)
+            except KeyError:
+                continue
+
+        return values
 
     def setValue(self, path: str, value: Any):
         """
@@ -305,6 +497,11 @@ class ConfigController(QObject):
         """
 
         setByPath(self.config, path, value)
+
+        # the path may replace or sit under other cached paths
+        self._valueCache.clear()
+        self.generation += 1
+
         self.onValueChanged.emit(path, value)
 
     def bulkSetValues(self, updates: dict[str, Any], parentPath: str = None):
@@ -13,13 +13,16 @@ from PySide6.QtCore import QTimer
 
 from datetime import datetime
 from matplotlib import pyplot
-from typing import Callable
+from typing import Callable, Optional
 
 import scipy.interpolate
+import logging
 import numpy
 import time
 import io
 
+logger = logging.getLogger(__name__)
+
 # graph functions
 def _smoothSeries(
     seriesX: numpy.ndarray,
@@ -119,8 +122,22 @@ class WeatherEvent(BaseEvent):
             "petting"
         )
 
+        # network lookups run in the background, the rest continues in _onWeatherData
         locationServices = context.sprite.locationServices
-        weatherData = locationServices.getWeatherData()
+        locationServices.getWeatherDataAsync(self._onWeatherData)
+
+    def _onWeatherData(self, weatherData: Optional[WeatherData]):
+        # this runs from a queued signal, outside the event manager's own error handling
+        try:
+            self._showWeather(weatherData)
+        except Exception as e:
+            logger.error(f"Error running event {self.id}: {e}")
+
+            self.lock.release()
+            self.onFinished()
+
+    def _showWeather(self, weatherData: Optional[WeatherData]):
+        context = self.context
 
         if weatherData is None or not weatherData.timestamps:
             self.lock.release()
@@ -76,10 +76,70 @@ class SpriteAnchorMixin:
 
         try:
             screen = sprite.screen()
-            return screen.availableGeometry() if screen else QRect(0, 0, 0, 0)
+
+            if not screen:
+                return QRect(0, 0, 0, 0)
+
+            # reuse the last answer until the sprite changes screen or the screen changes
+            cached = getattr(self, "_availableGeometryCache", None)
+
+            if (cached is not None) and (cached[0] is screen):
+                return QRect(cached[1])
+
+            self._watchAvailableGeometry(screen)
+
+            geometry = screen.availableGeometry()
+            self._availableGeometryCache = (screen, geometry)
+
+            return QRect(geometry)
         except Exception:
             return QRect(0, 0, 0, 0)
 
+    def _watchAvailableGeometry(self, screen) -> None:
+        """
+        Drop the cached available geometry whenever the screen setup changes.
+
+        :param screen: The screen whose geometry is about to be cached
+        :type screen: QScreen
+        """
+        watched = getattr(self, "_watchedScreens", None)
+
+        if watched is None:
+            watched = self._watchedScreens = []
+
+            app = QGuiApplication.instance()
+
+            if app is not None:
+                app.screenAdded.connect(self._dropAvailableGeometryCache)
+                app.screenRemoved.connect(self._forgetScreen)
+
+        if any(known is screen for known in watched):
+            return
+
+        watched.append(screen)
+        screen.availableGeometryChanged.connect(self._dropAvailableGeometryCache)
+
+    def _dropAvailableGeometryCache(self, *args) -> None:
+        """
+        Forget the cached available geometry so the next lookup asks the screen again.
+
+        :param args: Ignored signal arguments (the added screen or new geometry)
+        """
+        self._availableGeometryCache = None
+
+    def _forgetScreen(self, screen) -> None:
+        """
+        Drop the cached available geometry and stop tracking a removed screen.
+
+        :param screen: The screen that was removed
+        :type screen: QScreen
+        """
+        self._availableGeometryCache = None
+        self._watchedScreens = [
+            known for known in getattr(self, "_watchedScreens", None) or []
+            if known is not screen
+        ]
+
     def getOccluderWidgets(
         self,
         provider: Optional[Callable[[], Iterable[QWidget]]] = None,
@@ -0,0 +1,84 @@
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QApplication, QWidget
+
+from typing import Optional
+
+# the only application events a click-away window cares about
+CLICK_AWAY_EVENTS = frozenset({
+    QEvent.MouseButtonPress,
+    QEvent.ApplicationDeactivate,
+})
+
+class ClickAwayFilter(QObject):
+    """
+    single application-wide event filter shared by every window that closes on outside clicks
+    """
+
+    def __init__(self):
+        """
+        Initialise the shared click-away filter.
+        """
+        super().__init__()
+
+        self.windows: list[QWidget] = []
+        self.installed = False
+
+    def register(self, window: QWidget) -> None:
+        """
+        Start forwarding mouse presses and deactivation to a window's eventFilter.
+
+        :param window: The window to forward events to
+        :type window: QWidget
+        """
+        if window in self.windows:
+            return
+
+        self.windows.append(window)
+
+        if not self.installed:
+            QApplication.instance().installEventFilter(self)
+            self.installed = True
+
+    def unregister(self, window: QWidget) -> None:
+        """
+        Stop forwarding events to a window, removing the filter once nobody is listening.
+
+        :param window: The window to stop forwarding events to
+        :type window: QWidget
+        """
+        if window in self.windows:
+            self.windows.remove(window)
+
+        if self.installed and not self.windows:
+            QApplication.instance().removeEventFilter(self)
+            self.installed = False
+
+    def eventFilter(self, watched, event) -> bool:
+        # reject everything else before touching any window
+        if event.type() not in CLICK_AWAY_EVENTS:
+            return False
+
+        # windows may unregister themselves while handling the event
+        for window in tuple(self.windows):
+            try:
+                window.eventFilter(watched, event)
+            except Exception:
+                pass
+
+        return False
+
+_sharedFilter: Optional[ClickAwayFilter] = None
+
+def sharedClickAwayFilter() -> ClickAwayFilter:
+    """
+    Get the click-away filter shared across the app, creating it on first use.
+
+    :return: The shared click-away filter
+    :rtype: ClickAwayFilter
+    """
+    global _sharedFilter
+
+    if _sharedFilter is None:
+        _sharedFilter = ClickAwayFilter()
+
+    return _sharedFilter
@@ -1,6 +1,6 @@
 from .typography import BodyLabel, HeadingLabel, MutedLabel, SubheadingLabel
 from .primitives import CardFrame, Divider, InsetFrame, SurfaceFrame
-from .layout import ContentColumn, ContentRow, makeIconSquare
+from .layout import ContentColumn, ContentRow, makeIconSquare, makeIconSquareImage
 from .button import CloseButton, RockButton, RockIconButton
 from .dropdown import DropdownSpec, RockDropdown
 from .switch import ToggleSwitch
@@ -1,7 +1,7 @@
 from ..styling import PADDING
 
 from PySide6.QtWidgets import QHBoxLayout, QVBoxLayout, QWidget
-from PySide6.QtGui import QIcon, QPixmap, QPainter
+from PySide6.QtGui import QIcon, QImage, QPixmap, QPainter
 from PySide6.QtCore import Qt, QSize
 
 from typing import Optional
@@ -38,6 +38,39 @@ def makeIconSquare(
 
     return QIcon(canvas)
 
+def makeIconSquareImage(
+    source: QImage,
+    size: QSize = QSize(32, 32),
+    margin: int = 2
+) -> QImage:
+    # QImage counterpart of makeIconSquare, safe to run off the ui thread
+    if source.isNull():
+        return QImage()
+
+    width, height = size.width(), size.height()
+    canvas = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    canvas.fill(Qt.transparent)
+
+    availableWidth = max(1, width - margin * 2)
+    availableHeight = max(1, height - margin * 2)
+
+    scaled = source.scaled(
+        availableWidth,
+        availableHeight,
+        Qt.KeepAspectRatio,
+        Qt.SmoothTransformation
+    )
+
+    x = (width - scaled.width()) // 2
+    y = (height - scaled.height()) // 2
+
+    painter = QPainter(canvas)
+    painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+    painter.drawImage(x, y, scaled)
+    painter.end()
+
+    return canvas
+
 class ContentColumn(QVBoxLayout):
     def __init__(self, parent: Optional[QWidget] = None, *, spacing: Optional[int] = 0):
         super().__init__(parent)
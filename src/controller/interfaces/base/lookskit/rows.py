@@ -3,7 +3,7 @@ from .typography import BodyLabel
 from .switch import ToggleSwitch
 from ..styling import PADDING
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -16,27 +16,51 @@ from PySide6.QtWidgets import (
 
 from typing import Callable, List, Optional
 
-def buildTextInputRow(
+# one frame at 60hz, the most often a dragged slider's value label repaints
+SLIDER_LABEL_INTERVAL_MS = 16
+
+def _buildLabelledRow(
     label: str,
-    onChanged: Optional[Callable[[str], None]] = None,
-    max_length: int = 32,
+    labelWidth: int = 120,
     parent: Optional[QWidget] = None,
-) -> tuple[QWidget, QLineEdit]:
+) -> tuple[QWidget, QHBoxLayout]:
+    """
+    build the shared row shell: a horizontal layout with a fixed-width name label.
+    
+    :param label: the label text to display
+    :type label: str
+    :param labelWidth: fixed width of the name label
+    :type labelWidth: int
+    :param parent: parent widget
+    :type parent: Optional[QWidget]
+    :return: tuple of (row widget, row layout)
+    :rtype: tuple[QWidget, QHBoxLayout]
+    """
     row = QWidget(parent)
     layout = QHBoxLayout(row)
     layout.setContentsMargins(0, 0, 0, 0)
     layout.setSpacing(PADDING // 2)
 
     nameLabel = BodyLabel(label, selectable=False)
-    nameLabel.setFixedWidth(120)
+    nameLabel.setFixedWidth(labelWidth)
     layout.addWidget(nameLabel, 0)
 
+    return row, layout
+
+def buildTextInputRow(
+    label: str,
+    onChanged: Optional[Callable[[str], None]] = None,
+    max_length: int = 32,
+    parent: Optional[QWidget] = None,
+) -> tuple[QWidget, QLineEdit]:
+    row, layout = _buildLabelledRow(label, parent=parent)
+
     textEdit = QLineEdit()
     textEdit.setMaxLength(max_length)
     layout.addWidget(textEdit, 1)
 
     if onChanged is not None:
-        textEdit.textChanged.connect(onChanged)
+        textEdit.textChanged.connect(onChanged, Qt.DirectConnection)
 
     return row, textEdit
 
@@ -48,20 +72,13 @@ def buildDropdownRow(
 ) -> tuple[QWidget, "RockDropdown"]:
     from .dropdown import RockDropdown
 
-    row = QWidget(parent)
-    layout = QHBoxLayout(row)
-    layout.setContentsMargins(0, 0, 0, 0)
-    layout.setSpacing(PADDING // 2)
-
-    nameLabel = BodyLabel(label, selectable=False)
-    nameLabel.setFixedWidth(120)
-    layout.addWidget(nameLabel, 0)
+    row, layout = _buildLabelledRow(label, parent=parent)
 
     dropdown = RockDropdown(items=items)
     layout.addWidget(dropdown, 1)
 
     if onChanged is not None:
-        dropdown.currentTextChanged.connect(onChanged)
+        dropdown.currentTextChanged.connect(onChanged, Qt.DirectConnection)
 
     return row, dropdown
 
@@ -75,14 +92,7 @@ def buildSliderRow(
     showPercentage: bool = False,
     parent: Optional[QWidget] = None,
 ) -> tuple[QWidget, QSlider, QLabel]:
-    row = QWidget(parent)
-    layout = QHBoxLayout(row)
-    layout.setContentsMargins(0, 0, 0, 0)
-    layout.setSpacing(PADDING // 2)
-
-    nameLabel = BodyLabel(label, selectable=False)
-    nameLabel.setFixedWidth(labelWidth)
-    layout.addWidget(nameLabel, 0)
+    row, layout = _buildLabelledRow(label, labelWidth, parent)
 
     slider = QSlider(Qt.Horizontal)
     slider.setRange(min_val, max_val)
@@ -106,7 +116,7 @@ def buildSliderRow(
         if onChanged is not None:
             onChanged(v)
 
-    slider.valueChanged.connect(onValueChanged)
+    slider.valueChanged.connect(onValueChanged, Qt.DirectConnection)
 
     if showPercentage:
         percentage = int(round((min_val - min_val) / (max_val - min_val) * 100)) if max_val > min_val else 0
@@ -125,14 +135,7 @@ def buildSpinboxRow(
     onChanged: Optional[Callable[[int], None]] = None,
     parent: Optional[QWidget] = None,
 ) -> tuple[QWidget, QSpinBox]:
-    row = QWidget(parent)
-    layout = QHBoxLayout(row)
-    layout.setContentsMargins(0, 0, 0, 0)
-    layout.setSpacing(PADDING // 2)
-
-    nameLabel = BodyLabel(label, selectable=False)
-    nameLabel.setFixedWidth(120)
-    layout.addWidget(nameLabel, 0)
+    row, layout = _buildLabelledRow(label, parent=parent)
 
     spinbox = QSpinBox()
     spinbox.setMinimum(minValue)
@@ -145,7 +148,7 @@ def buildSpinboxRow(
     layout.addWidget(spinbox, 1)
 
     if onChanged is not None:
-        spinbox.valueChanged.connect(onChanged)
+        spinbox.valueChanged.connect(onChanged, Qt.DirectConnection)
 
     return row, spinbox
 
@@ -157,14 +160,7 @@ def buildScaleSliderRow(
     onReleased: Optional[Callable[[float], None]] = None,
     parent: Optional[QWidget] = None,
 ) -> tuple[QWidget, QSlider, QLabel]:
-    row = QWidget(parent)
-    layout = QHBoxLayout(row)
-    layout.setContentsMargins(0, 0, 0, 0)
-    layout.setSpacing(PADDING // 2)
-
-    nameLabel = BodyLabel(label, selectable=False)
-    nameLabel.setFixedWidth(74)
-    layout.addWidget(nameLabel, 0)
+    row, layout = _buildLabelledRow(label, 74, parent)
 
     sliderMin = int(minScale * 100)
     sliderMax = int(maxScale * 100)
@@ -181,12 +177,25 @@ def buildScaleSliderRow(
     valueLabel.setFixedWidth(42)
     layout.addWidget(valueLabel, 0)
 
+    # coalesce label updates while dragging, the timer reads the latest value when it fires
+    labelTimer = QTimer(row)
+    labelTimer.setSingleShot(True)
+    labelTimer.setInterval(SLIDER_LABEL_INTERVAL_MS)
+
+    def updateLabel() -> None:
+        text = f"{slider.value() / 100.0:.2f}x"
+
+        if valueLabel.text() != text:
+            valueLabel.setText(text)
+
+    labelTimer.timeout.connect(updateLabel, Qt.DirectConnection)
+
     def onValueChanged(v: int) -> None:
-        scale = v / 100.0
-        valueLabel.setText(f"{scale:.2f}x")
+        if not labelTimer.isActive():
+            labelTimer.start()
 
         if onChanged is not None:
-            onChanged(scale)
+            onChanged(v / 100.0)
 
     def onSliderReleased() -> None:
         scale = slider.value() / 100.0
@@ -194,8 +203,8 @@ def buildScaleSliderRow(
         if onReleased is not None:
             onReleased(scale)
 
-    slider.valueChanged.connect(onValueChanged)
-    slider.sliderReleased.connect(onSliderReleased)
+    slider.valueChanged.connect(onValueChanged, Qt.DirectConnection)
+    slider.sliderReleased.connect(onSliderReleased, Qt.DirectConnection)
 
     return row, slider, valueLabel
 
@@ -216,14 +225,7 @@ def buildSwitchRow(
     :return: tuple of (row widget, toggle switch)
     :rtype: tuple[QWidget, ToggleSwitch]
     """
-    row = QWidget(parent)
-    layout = QHBoxLayout(row)
-    layout.setContentsMargins(0, 0, 0, 0)
-    layout.setSpacing(PADDING // 2)
-
-    nameLabel = BodyLabel(label, selectable=False)
-    nameLabel.setFixedWidth(120)
-    layout.addWidget(nameLabel, 0)
+    row, layout = _buildLabelledRow(label, parent=parent)
 
     switch = ToggleSwitch(onChanged=onChanged)
     layout.addWidget(switch, 0, Qt.AlignLeft)
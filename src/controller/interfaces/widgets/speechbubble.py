@@ -69,6 +69,7 @@ class SpeechBubbleComponent(InterfaceComponent, SpriteAnchorMixin):
         self.tailDirection = "right"
 
         self.fullText = ""
+        self.shownText = ""
         self.currentCharacterIndex = 0
         self.currentTypingDelay = CHARACTERS_PER_SECOND[0]
 
@@ -150,14 +151,24 @@ class SpeechBubbleComponent(InterfaceComponent, SpriteAnchorMixin):
         self.inputContainer.hide()
         bodyLayout.addWidget(self.inputContainer)
 
+        self._inputVisible = False
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, TAIL_SIZE)
         layout.addWidget(self.body)
 
         self.typeTimer = QTimer(self)
+        self.typeTimer.setTimerType(Qt.PreciseTimer)
         self.typeTimer.timeout.connect(self._typeNextCharacter)
 
-        self.followTimer.start()
+        self._cachedTailKey = None
+        self._cachedTailPolygon = None
+
+        # last (size, sprite, screen, occluders, visible) state _reposition anchored against
+        self._lastRepositionKey = None
+
+        # visible occluders the bubble was last stacked against
+        self._lastStackKey = None
 
         # hacky fix:
         # prevent qt geometry warnings
@@ -175,6 +186,13 @@ class SpeechBubbleComponent(InterfaceComponent, SpriteAnchorMixin):
         :type visible: bool
         """
 
+        visible = bool(visible)
+
+        if visible == self._inputVisible:
+            return
+
+        self._inputVisible = visible
+
         if visible:
             self.inputContainer.show()
 
@@ -261,9 +279,12 @@ class SpeechBubbleComponent(InterfaceComponent, SpriteAnchorMixin):
             )
 
         self.fullText = text
+        self.shownText = ""
         self.currentCharacterIndex = 0
         self.currentTypingDelay = int(typingDelay)
 
+        wasVisible = self.isVisible()
+
         self.label.setText("")
         self._updateSize()
         self._reposition(forceShow=True)
@@ -277,13 +298,20 @@ class SpeechBubbleComponent(InterfaceComponent, SpriteAnchorMixin):
                 pass
 
         self.fadeIn()
-        self.raise_()
         self.followTimer.start()
 
-        if self.sprite:
-            self.sprite.raise_()
+        # back-to-back messages: already stacked, skip the window manager round trips
+        stackKey = tuple(id(widget) for widget in self.getOccluderWidgets(self.occludersProvider))
+
+        if not wasVisible or stackKey != self._lastStackKey:
+            self.raise_()
+
+            if self.sprite:
+                self.sprite.raise_()
+
+            self.restackOccluders(self.occludersProvider)
+            self._lastStackKey = stackKey
 
-        self.restackOccluders(self.occludersProvider)
         self.typeTimer.start(self.currentTypingDelay)
 
     def skipTyping(self) -> None:
@@ -310,6 +338,8 @@ class SpeechBubbleComponent(InterfaceComponent, SpriteAnchorMixin):
         self.typeTimer.stop()
 
         if showFullText:
+            self.shownText = self.fullText
+            self.currentCharacterIndex = len(self.fullText)
             self.label.setText(self.fullText)
             self._updateSize()
 
@@ -345,13 +375,15 @@ class SpeechBubbleComponent(InterfaceComponent, SpriteAnchorMixin):
             self.typingFinished.emit()
             return
 
+        # append the next character instead of re-slicing the whole prefix each tick
+        character = self.fullText[self.currentCharacterIndex]
         self.currentCharacterIndex += 1
-        self.label.setText(self.fullText[:self.currentCharacterIndex])
+        self.shownText += character
+
+        self.label.setText(self.shownText)
         self._updateSize()
         self._reposition()
 
-        character = self.fullText[self.currentCharacterIndex - 1:self.currentCharacterIndex]
-
         if character.isalnum():
             try:
                 self.blip()
@@ -367,6 +399,11 @@ class SpeechBubbleComponent(InterfaceComponent, SpriteAnchorMixin):
         """
 
         if endOpacity <= 0.001:
+            # nothing to type or follow while faded out
+            self.typeTimer.stop()
+            self.followTimer.stop()
+            self._lastStackKey = None
+
             self.fadeOutFinished.emit()
 
     def _updateSize(self) -> None:
@@ -421,11 +458,28 @@ class SpeechBubbleComponent(InterfaceComponent, SpriteAnchorMixin):
         if forceShow:
             self.show()
 
+        occluders = self.getOccluderBounds(self.occludersProvider)
+
+        # nothing that affects the anchor moved since last time,
+        # so the target would be identical
+        key = (
+            self.size().toTuple(),
+            self.spriteFrameGeometry().getRect(),
+            self.spriteAvailableGeometry().getRect(),
+            tuple(rect.getRect() for rect in occluders),
+            self.isVisible(),
+        )
+
+        if not forceShow and key == self._lastRepositionKey:
+            return
+
+        self._lastRepositionKey = key
+
         target = self.anchorNextToSprite(
             yAlign="center",
             preferredSide="right",
             margin=BORDER_MARGIN,
-            occludersProvider=self.occludersProvider,
+            occluders=occluders,
         )
 
         prev_tail = self.tailDirection
@@ -456,10 +510,26 @@ class SpeechBubbleComponent(InterfaceComponent, SpriteAnchorMixin):
         painter.setBrush(BACKGROUND_COLOR)
         painter.setPen(Qt.NoPen)
 
+        painter.drawPolygon(self._tailPolygon())
+
+    def _tailPolygon(self) -> QPolygon:
+        """
+        get the tail polygon, only rebuilding it when the body geometry
+        or tail direction changes.
+
+        :return: the tail polygon
+        :rtype: QPolygon
+        """
+
         label_rect = self.body.geometry()
         base_x = label_rect.center().x()
         base_y = label_rect.bottom()
 
+        key = (base_x, base_y, self.tailDirection)
+
+        if key == self._cachedTailKey:
+            return self._cachedTailPolygon
+
         if self.tailDirection == "left":
             tip = QPoint(base_x - TAIL_SIZE, base_y + TAIL_SIZE)
         else:
@@ -467,4 +537,7 @@ class SpeechBubbleComponent(InterfaceComponent, SpriteAnchorMixin):
 
         left = QPoint(base_x - TAIL_SIZE // 2, base_y)
         right = QPoint(base_x + TAIL_SIZE // 2, base_y)
-        painter.drawPolygon(QPolygon([left, tip, right]))
+
+        self._cachedTailKey = key
+        self._cachedTailPolygon = QPolygon([left, tip, right])
+        return self._cachedTailPolygon
@@ -18,18 +18,30 @@ from ..base.styling import (
     BORDER_RADIUS,
     DEFAULT_FONT,
     PADDING,
+    SUBHEADING_FONT,
     TEXT_COLOR,
     asRGB,
 )
 
-from PySide6.QtCore import Qt, QSize, QEvent, QTimer
-from PySide6.QtGui import QColor
+from PySide6.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QRect,
+    QSize,
+    QTimer,
+)
+
+from PySide6.QtGui import QColor, QFontMetrics
 from PySide6.QtWidgets import (
     QApplication,
     QAbstractItemView,
     QHBoxLayout,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QVBoxLayout,
     QWidget,
 )
@@ -39,6 +51,141 @@ from typing import Callable, Iterable, Optional
 # this only runs while the window is open
 REFRESH_INTERVAL = 1000
 
+EVENT_ID_ROLE = Qt.UserRole
+EVENT_STATUS_ROLE = Qt.UserRole + 1
+
+STATUS_COLOR = QColor(TEXT_COLOR)
+STATUS_COLOR.setAlpha(170)
+
+class EventListModel(QAbstractListModel):
+    """
+    flat list model of events shown in the event picker.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # [eventId, title, status]
+        self._rows: list[list] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+
+        eventId, title, status = self._rows[index.row()]
+
+        if role == Qt.DisplayRole:
+            return title
+
+        if role == EVENT_ID_ROLE:
+            return eventId
+
+        if role == EVENT_STATUS_ROLE:
+            return status
+
+        return None
+
+    def setEvents(self, events: Iterable[tuple[str, str]]) -> None:
+        """
+        replace all rows with the given (eventId, title) pairs.
+
+        :param events: the events to show, in display order
+        :type events: Iterable[tuple[str, str]]
+        """
+
+        self.beginResetModel()
+        self._rows = [[eventId, str(title), ""] for eventId, title in events]
+        self.endResetModel()
+
+    def eventIdAt(self, row: int):
+        return self._rows[row][0]
+
+    def setRowStatus(self, row: int, status: str) -> None:
+        """
+        update the status line of a row, only notifying views when it changed.
+
+        :param row: the row to update
+        :type row: int
+        :param status: the new status text
+        :type status: str
+        """
+
+        entry = self._rows[row]
+
+        if entry[2] == status:
+            return
+
+        entry[2] = status
+
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [EVENT_STATUS_ROLE])
+
+class EventItemDelegate(QStyledItemDelegate):
+    """
+    paints an event row as a title line with a muted status line below it.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._titleMetrics = QFontMetrics(DEFAULT_FONT)
+        self._statusMetrics = QFontMetrics(SUBHEADING_FONT)
+
+        # every row is a title line plus one status line, so they all share a height
+        self._rowHeight = (
+            PADDING // 3
+            + self._titleMetrics.height()
+            + PADDING // 6
+            + PADDING // 4
+            + self._statusMetrics.height()
+            + PADDING // 2
+        )
+
+    def _contentRect(self, rect: QRect) -> QRect:
+        return rect.adjusted(PADDING // 2, PADDING // 3, -(PADDING // 2), -(PADDING // 2))
+
+    def paint(self, painter, option, index) -> None:
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+
+        # background (hover/selected) still comes from the stylesheet
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        content = self._contentRect(option.rect)
+        titleHeight = self._titleMetrics.height()
+        statusTop = content.top() + titleHeight + PADDING // 6 + PADDING // 4
+
+        painter.save()
+
+        painter.setFont(DEFAULT_FONT)
+        painter.setPen(TEXT_COLOR)
+        painter.drawText(
+            QRect(content.left(), content.top(), content.width(), titleHeight),
+            Qt.AlignLeft | Qt.AlignVCenter,
+            self._titleMetrics.elidedText(str(index.data(Qt.DisplayRole) or ""), Qt.ElideRight, content.width()),
+        )
+
+        painter.setFont(SUBHEADING_FONT)
+        painter.setPen(STATUS_COLOR)
+        painter.drawText(
+            QRect(content.left(), statusTop, content.width(), self._statusMetrics.height()),
+            Qt.AlignLeft | Qt.AlignVCenter,
+            self._statusMetrics.elidedText(str(index.data(EVENT_STATUS_ROLE) or ""), Qt.ElideRight, content.width()),
+        )
+
+        painter.restore()
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), self._rowHeight)
+
 class EventPickerWindowComponent(InterfaceComponent, SpriteAnchorMixin):
     """
     Window for picking and triggering sprite events manually.
@@ -69,8 +216,13 @@ class EventPickerWindowComponent(InterfaceComponent, SpriteAnchorMixin):
 
         self.setOpacity(0.0)
 
+        # sorted (eventId, eventName) pairs, keyed by the set of discovered events
+        self._sortedEventsKey: Optional[frozenset] = None
+        self._sortedEventsCache: tuple[tuple[str, str], ...] = ()
+
         self._refreshTimer = QTimer(self)
         self._refreshTimer.setInterval(REFRESH_INTERVAL)
+        self._refreshTimer.setTimerType(Qt.VeryCoarseTimer)
         self._refreshTimer.timeout.connect(self.refresh)
 
     def build(self) -> None:
@@ -115,14 +267,19 @@ class EventPickerWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         self.statusLabel.hide()
         rootLayout.addWidget(self.statusLabel)
 
-        self.listWidget = QListWidget()
-        self.listWidget.setObjectName("eventList")
-        self.listWidget.setFont(DEFAULT_FONT)
-        self.listWidget.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.listWidget.setIconSize(QSize(16, 16))
-        self.listWidget.setSpacing(0)
-        self.listWidget.itemClicked.connect(self._onClicked)
-        rootLayout.addWidget(self.listWidget)
+        self._model = EventListModel(self)
+
+        self.listView = QListView()
+        self.listView.setObjectName("eventList")
+        self.listView.setFont(DEFAULT_FONT)
+        self.listView.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.listView.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.listView.setSpacing(0)
+        self.listView.setUniformItemSizes(True)
+        self.listView.setModel(self._model)
+        self.listView.setItemDelegate(EventItemDelegate(self.listView))
+        self.listView.clicked.connect(self._onClicked)
+        rootLayout.addWidget(self.listView)
 
         # style
         onHoverBackground = QColor(BACKGROUND_COLOR).darker(106)
@@ -146,34 +303,22 @@ class EventPickerWindowComponent(InterfaceComponent, SpriteAnchorMixin):
                 padding: 0px;
             }}
 
-            QLabel#eventItemTitle {{
-                color: {asRGB(TEXT_COLOR)};
-                padding: 0px;
-            }}
-
-            QLabel#eventItemStatus {{
-                color: rgba({TEXT_COLOR.red()}, {TEXT_COLOR.green()}, {TEXT_COLOR.blue()}, 170);
-                padding: 0px;
-            }}
-
-            QListWidget#eventList {{
+            QListView#eventList {{
                 background: transparent;
                 border: none;
                 color: {asRGB(TEXT_COLOR)};
                 outline: none;
             }}
 
-            QListWidget#eventList::item {{
+            QListView#eventList::item {{
                 border-radius: {BORDER_RADIUS}px;
-                padding: {PADDING // 2}px;
-                min-height: {DEFAULT_FONT.pointSize() * 2}px;
             }}
 
-            QListWidget#eventList::item:hover {{
+            QListView#eventList::item:hover {{
                 background-color: {asRGB(onHoverBackground)};
             }}
 
-            QListWidget#eventList::item:selected {{
+            QListView#eventList::item:selected {{
                 background-color: {asRGB(onSelectBackground)};
             }}
             """,
@@ -203,111 +348,52 @@ class EventPickerWindowComponent(InterfaceComponent, SpriteAnchorMixin):
 
         return super().hideEvent(event)
 
-    def _buildItemWidget(self, title: str) -> QWidget:
-        container = QWidget()
-        layout = QVBoxLayout(container)
-        layout.setContentsMargins(PADDING // 2, PADDING // 3, PADDING // 2, PADDING // 2)
-        layout.setSpacing(PADDING // 4)
-
-        titleLabel = BodyLabel(title, wrap=False, selectable=False)
-        titleLabel.setObjectName("eventItemTitle")
-        titleLabel.setContentsMargins(0, 0, 0, PADDING // 6)
-
-        statusLabel = SubheadingLabel("available")
-        statusLabel.setObjectName("eventItemStatus")
-        statusLabel.setMaximumHeight(DEFAULT_FONT.pointSize() + 2)
-
-        layout.addWidget(titleLabel)
-        layout.addWidget(statusLabel)
-
-        return container
-
-    def _createListItem(self, eventId, eventName: str) -> None:
-        item = QListWidgetItem()
-        item.setData(Qt.UserRole, eventId)
-        item.setData(69420, eventName)
-
-        widget = self._buildItemWidget(str(eventName))
-        item.setSizeHint(widget.sizeHint())
-
-        self.listWidget.addItem(item)
-        self.listWidget.setItemWidget(item, widget)
-
-    def _updateItemDisplay(self, item: QListWidgetItem) -> None:
-        eventId = item.data(Qt.UserRole)
-        eventName = item.data(69420) # lool
-
-        widget = self.listWidget.itemWidget(item)
-
-        if not widget:
-            return
-
-        titleLabel = widget.findChild(BodyLabel, "eventItemTitle")
-        statusLabel = widget.findChild(SubheadingLabel, "eventItemStatus")
-
-        if titleLabel:
-            titleLabel.setText(
-                "random" if eventId == "__random__" else str(eventName)
-            )
+    def _statusText(self, eventId) -> str:
+        if eventId == "__random__":
+            return "pick a random event (if any available)"
 
-        statusText = ""
+        event = self.eventManager.getEvent(eventId)
+        isEnabled = self.eventManager.isEventEnabled(eventId)
+        cooldownTime = self.eventManager.getFriendlyCooldownText(eventId)
 
-        if eventId == "__random__":
-            statusText = "pick a random event (if any available)"
-        else:
-            event = self.eventManager.getEvent(eventId)
-            isEnabled = self.eventManager.isEventEnabled(eventId)
-            cooldownTime = self.eventManager.getFriendlyCooldownText(eventId)
-
-            if event is None: # ????
-                statusText = "wtf"
-            elif not isEnabled:
-                statusText = "disabled"
-            elif cooldownTime is not None:
-                statusText = f"disabled until: {cooldownTime}"
-            else:
-                statusText = "available"
-
-        if statusLabel:
-            statusLabel.setText(statusText)
+        if event is None: # ????
+            return "wtf"
+        elif not isEnabled:
+            return "disabled"
+        elif cooldownTime is not None:
+            return f"disabled until: {cooldownTime}"
 
-        try:
-            item.setSizeHint(widget.sizeHint())
-        except Exception:
-            pass
+        return "available"
 
     def refresh(self, fullRebuild: bool = False) -> None:
-        """Refresh list labels (and optionally rebuild items)."""
+        """Refresh row statuses (and optionally rebuild the rows)."""
 
-        if not hasattr(self, "listWidget"):
+        if not hasattr(self, "listView"):
             return
 
         if fullRebuild:
-            self.listWidget.clear()
-
-            # random option
-            self._createListItem("__random__", "random")
+            # random option first, then discovered events
+            self._model.setEvents(
+                (("__random__", "random"),) + self._getSortedEvents()
+            )
 
-            # discovered events
-            events = self.eventManager.getEvents()
+        # only rows whose status text changed get repainted
+        for row in range(self._model.rowCount()):
+            self._model.setRowStatus(row, self._statusText(self._model.eventIdAt(row)))
 
-            for eventId, eventName in sorted(events, key=lambda s: str(s[0]).lower()):
-                self._createListItem(eventId, eventName)
+    def _getSortedEvents(self) -> tuple[tuple[str, str], ...]:
+        """Discovered events sorted by id (only re-sorted when the event set changes)."""
 
-        # update labels in place
-        for index in range(self.listWidget.count()):
-            item = self.listWidget.item(index)
+        events = self.eventManager.getEvents()
+        key = frozenset(events)
 
-            if not item:
-                continue
+        if key != self._sortedEventsKey:
+            decorated = sorted((str(eventId).lower(), eventId, eventName) for eventId, eventName in events)
 
-            self._updateItemDisplay(item)
+            self._sortedEventsCache = tuple((eventId, eventName) for _, eventId, eventName in decorated)
+            self._sortedEventsKey = key
 
-        # sizing tweak
-        try:
-            self.listWidget.doItemsLayout()
-        except Exception:
-            pass
+        return self._sortedEventsCache
 
     def _flashStatus(self, text: str, ms: int = 2000) -> None:
         try:
@@ -318,18 +404,18 @@ class EventPickerWindowComponent(InterfaceComponent, SpriteAnchorMixin):
 
         QTimer.singleShot(ms, lambda: self.statusLabel.hide())
 
-    def _onClicked(self, item: QListWidgetItem) -> None:
-        if not item:
+    def _onClicked(self, index: QModelIndex) -> None:
+        if not index.isValid():
             return
 
-        eventId = item.data(Qt.UserRole)
+        eventId = index.data(EVENT_ID_ROLE)
 
         # clear selection state quickly
         try:
-            self.listWidget.clearSelection()
-            self.listWidget.setCurrentRow(-1)
-            self.listWidget.clearFocus()
-            viewport = self.listWidget.viewport()
+            self.listView.clearSelection()
+            self.listView.setCurrentIndex(QModelIndex())
+            self.listView.clearFocus()
+            viewport = self.listView.viewport()
             QApplication.sendEvent(viewport, QEvent(QEvent.Leave))
             viewport.update()
         except Exception:
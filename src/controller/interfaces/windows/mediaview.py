@@ -12,9 +12,19 @@ from ..base.lookskit import (
 
 from ..base.styling import BORDER_MARGIN, PADDING
 
-from PySide6.QtCore import QSize, Qt, QUrl, Signal, QTimer, QEvent
-from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtGui import QDesktopServices, QPixmap
+from PySide6.QtCore import (
+    QEvent,
+    QObject,
+    QRunnable,
+    QSize,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    Qt,
+    Signal,
+)
+
+from PySide6.QtGui import QDesktopServices, QImage, QPixmap
 
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -26,13 +36,72 @@ from PySide6.QtWidgets import (
     QSizePolicy
 )
 
-from typing import Optional
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, Optional
 
+import hashlib
 import re
 
 MAX_SIZE = QSize(1280, 720)
 MIN_SIZE = QSize(360, 240)
 
+# how many scaled copies of the current image to keep around
+SCALED_CACHE_SIZE = 4
+
+# how long resizing has to settle before the smooth rescale
+SMOOTH_SCALE_DELAY_MS = 24
+
+# viewport changes at least this big (relative) get a smooth rescale straight away,
+# smaller drag steps wait for the debounce
+SMOOTH_SCALE_JUMP = 0.05
+
+IFRAME_HTML_TEMPLATE = """
+    <!doctype html>
+        <html>
+            <head>
+                <meta charset="utf-8" />
+                <meta name="viewport" content="width=device-width, initial-scale=1" />
+                <style>
+                    html, body {
+                    margin: 0;
+                    padding: 0;
+                    background: #000;
+                    width: 100%;
+                    height: 100%;
+                    overflow: hidden;
+                    }
+                    .wrap {
+                    position: absolute;
+                    inset: 0;
+                    }
+                    iframe {
+                    position: absolute;
+                    inset: 0;
+                    width: 100%;
+                    height: 100%;
+                    border: 0;
+                    }
+                </style>
+            </head>
+        <body>
+            <div class="wrap">{iframe}</div>
+        </body>
+    </html>
+"""
+
+# how many decoded images (by content hash) to keep for repeat loads
+DECODED_CACHE_SIZE = 4
+
+# images bigger than this get reduced once before any viewport scaling,
+# the window never shows more than MAX_SIZE anyway
+SCALE_MASTER_SIZE = MAX_SIZE * 1.25
+
+YOUTUBE_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{11}")
+YOUTUBE_URL_PATTERN = re.compile(
+    r"(?:v=|youtu\.be/|/embed/|/shorts/|/e/|/v/)([A-Za-z0-9_-]{11})"
+)
+
 def getYouTubeId(url: str) -> Optional[str]:
     """
     extract a video id from a url-ish string
@@ -49,23 +118,57 @@ def getYouTubeId(url: str) -> Optional[str]:
         return None
 
     # its already a valid, full video Id
-    if re.fullmatch(r"[A-Za-z0-9_-]{11}", value):
+    if YOUTUBE_ID_PATTERN.fullmatch(value):
         return value
 
-    for pattern in [
-        r"(?:v=)([A-Za-z0-9_-]{11})",
-        r"(?:youtu\.be/)([A-Za-z0-9_-]{11})",
-        r"(?:/embed/)([A-Za-z0-9_-]{11})",
-        r"(?:/shorts/)([A-Za-z0-9_-]{11})"
-    ]:
-        match = re.search(pattern, value)
+    match = YOUTUBE_URL_PATTERN.search(value)
+    return match.group(1) if match else None
+
+def buildScaleMaster(image: QImage) -> QImage:
+    """
+    reduce an image to at most SCALE_MASTER_SIZE, keeping its aspect ratio
+
+    :param image: the source image
+    :type image: QImage
+    :return: the image itself if it's already small enough, otherwise a reduced copy
+    :rtype: QImage
+    """
+
+    if image.isNull():
+        return image
+
+    if image.width() <= SCALE_MASTER_SIZE.width() and image.height() <= SCALE_MASTER_SIZE.height():
+        return image
+
+    return image.scaled(
+        SCALE_MASTER_SIZE,
+        Qt.KeepAspectRatio,
+        Qt.SmoothTransformation,
+    )
+
+class _ImageTaskSignals(QObject):
+    finished = Signal(int, QImage)
+
+class _ImageTask(QRunnable):
+    """
+    runs an image job on the thread pool and reports the result back
+    through a queued signal, tagged with the token it was started with
+    """
+
+    def __init__(self, token: int, work: Callable[[], QImage]):
+        super().__init__()
 
-        if not match:
-            continue
+        self.token = token
+        self.work = work
+        self.signals = _ImageTaskSignals()
 
-        return match.group(1)
+    def run(self) -> None:
+        try:
+            image = self.work()
+        except Exception:
+            image = QImage()
 
-    return None
+        self.signals.finished.emit(self.token, image)
 
 class MediaViewWindow(InterfaceComponent, SpriteAnchorMixin):
     """
@@ -100,9 +203,38 @@ class MediaViewWindow(InterfaceComponent, SpriteAnchorMixin):
         self.setMinimumSize(MIN_SIZE)
         self.setMaximumSize(MAX_SIZE)
 
-        self.lastPixmap: Optional[QPixmap] = None
+        # kept as a QImage, only scaled copies become pixmaps. images loaded
+        # from bytes are already reduced by buildScaleMaster when decoded
+        self.lastImage: Optional[QImage] = None
+        self._imageDims: Optional[tuple[int, int]] = None
+        self._scaleMaster: Optional[QImage] = None
         self.lastURL: Optional[str] = None
 
+        # (scale master cacheKey, width, height) -> scaled pixmap, oldest first
+        self._scaledCache: OrderedDict[tuple[int, int, int], QPixmap] = OrderedDict()
+
+        # fast previews while resizing, one smooth pass once it settles
+        self._smoothScaleTimer = QTimer(self)
+        self._smoothScaleTimer.setSingleShot(True)
+        self._smoothScaleTimer.setInterval(SMOOTH_SCALE_DELAY_MS)
+        self._smoothScaleTimer.timeout.connect(self._applySmoothScaledPixmap)
+
+        # bumped whenever the shown content changes, so late decodes get dropped
+        self._decodeToken = 0
+        self._pendingDecode: Optional[tuple[str, str, bool]] = None
+
+        # content hash -> decoded (and reduced) image, oldest first
+        self._decodedCache: OrderedDict[str, QImage] = OrderedDict()
+
+        # same idea for smooth scales running on the pool
+        self._scaleToken = 0
+        self._pendingScaleKey: Optional[tuple[int, int, int]] = None
+        self._lastSmoothViewport: Optional[QSize] = None
+
+        # set while we resize ourselves to fit an image
+        self._duringProgrammaticResize = False
+        self._runningTasks: set[_ImageTask] = set()
+
     def build(self) -> None:
         """
         build the media view window UI
@@ -159,8 +291,10 @@ class MediaViewWindow(InterfaceComponent, SpriteAnchorMixin):
         self.stack.addWidget(self.imageScroll)
 
         # 2) web page
-        self.webView = QWebEngineView()
-        self.stack.addWidget(self.webView)
+        # the real view spins up chromium, so it's only made on first use
+        self.webView = None
+        self.webPlaceholder = QWidget()
+        self.stack.addWidget(self.webPlaceholder)
 
         rootLayout.addWidget(self.stack, 1)
 
@@ -224,8 +358,14 @@ class MediaViewWindow(InterfaceComponent, SpriteAnchorMixin):
         """
         self.ensureBuilt()
 
-        self.lastPixmap = None
+        self.lastImage = None
+        self._imageDims = None
+        self._scaleMaster = None
         self.lastURL = None
+        self._scaledCache.clear()
+
+        self._decodeToken += 1
+        self._pendingDecode = None
 
         self.imageLabel.clear()
         self.titleLabel.setText(title)
@@ -251,6 +391,18 @@ class MediaViewWindow(InterfaceComponent, SpriteAnchorMixin):
         :param openPanel: whether to open the panel after showing the image
         :type openPanel: bool
         """
+        self._showImageData(
+            pixmap.toImage(),
+            title=title,
+            openPanel=openPanel
+        )
+
+    def _showImageData(
+        self,
+        image: QImage,
+        title: str = "Image",
+        openPanel: bool = False
+    ) -> None:
         self.ensureBuilt()
 
         self.titleLabel.setText(title)
@@ -260,7 +412,14 @@ class MediaViewWindow(InterfaceComponent, SpriteAnchorMixin):
         if openPanel:
             self.open()
 
-        self.lastPixmap = pixmap
+        self._decodeToken += 1
+        self._pendingDecode = None
+
+        self.lastImage = image
+        self._imageDims = None if image.isNull() else (image.width(), image.height())
+        self._scaleMaster = buildScaleMaster(image)
+        self._scaledCache.clear()
+        self._lastSmoothViewport = None
         QTimer.singleShot(0, self._syncImageToViewport)
 
     def showImagefromBytes(
@@ -281,11 +440,93 @@ class MediaViewWindow(InterfaceComponent, SpriteAnchorMixin):
         """
         self.ensureBuilt()
 
-        pixmap = QPixmap()
-        pixmap.loadFromData(imageBytes)
+        data = bytes(imageBytes)
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+
+        cached = self._decodedCache.get(digest)
+
+        if cached is not None:
+            self._decodedCache.move_to_end(digest)
+
+            self._showImageData(
+                cached,
+                title=title,
+                openPanel=openPanel
+            )
+
+            return
+
+        # decode on the thread pool, QImage is safe to build off the ui thread
+        self._decodeToken += 1
+        self._pendingDecode = (digest, title, openPanel)
+
+        task = _ImageTask(self._decodeToken, lambda: buildScaleMaster(QImage.fromData(data)))
+        self._startImageTask(task, self._onImageDecoded)
+
+    def _startImageTask(self, task: _ImageTask, onFinished: Callable[[int, QImage], None]) -> None:
+        """
+        start an image task on the global thread pool
+
+        :param task: the task to run
+        :type task: _ImageTask
+        :param onFinished: slot receiving (token, image) on the ui thread
+        :type onFinished: Callable[[int, QImage], None]
+        """
+        # keep the task (and its signals object) alive until it reports back,
+        # the pool still deletes the runnable itself once it has run
+        self._runningTasks.add(task)
+
+        task.signals.finished.connect(
+            partial(self._onTaskFinished, task, onFinished),
+            Qt.QueuedConnection,
+        )
+
+        QThreadPool.globalInstance().start(task)
+
+    def _onTaskFinished(
+        self,
+        task: _ImageTask,
+        onFinished: Callable[[int, QImage], None],
+        token: int,
+        image: QImage
+    ) -> None:
+        """
+        release a finished image task and hand its result on
+
+        :param task: the task that finished
+        :type task: _ImageTask
+        :param onFinished: slot receiving (token, image)
+        :type onFinished: Callable[[int, QImage], None]
+        :param token: the token the task was started with
+        :type token: int
+        :param image: the resulting image
+        :type image: QImage
+        """
+        self._runningTasks.discard(task)
+
+        # the connection holds the task, drop it so the task can be freed
+        try:
+            task.signals.finished.disconnect()
+        except Exception:
+            pass
+
+        onFinished(token, image)
+
+    def _onImageDecoded(self, token: int, image: QImage) -> None:
+        if token != self._decodeToken or self._pendingDecode is None:
+            return
+
+        digest, title, openPanel = self._pendingDecode
+        self._pendingDecode = None
+
+        if not image.isNull():
+            self._decodedCache[digest] = image
+
+            while len(self._decodedCache) > DECODED_CACHE_SIZE:
+                self._decodedCache.popitem(last=False)
 
-        self.showImage(
-            pixmap,
+        self._showImageData(
+            image,
             title=title,
             openPanel=openPanel
         )
@@ -307,6 +548,11 @@ class MediaViewWindow(InterfaceComponent, SpriteAnchorMixin):
         :type openPanel: bool
         """
         self.ensureBuilt()
+        self._ensureWebView()
+
+        # a decode still running for an earlier image must not replace the page
+        self._decodeToken += 1
+        self._pendingDecode = None
 
         self.lastURL = url
         self.titleLabel.setText(title)
@@ -343,6 +589,7 @@ class MediaViewWindow(InterfaceComponent, SpriteAnchorMixin):
         raise NotImplementedError("YouTube embedding is currently disabled due to WebCodecs issues.")
 
         self.ensureBuilt()
+        self._ensureWebView()
 
         videoId = getYouTubeId(urlOrId)
         if not videoId:
@@ -354,6 +601,10 @@ class MediaViewWindow(InterfaceComponent, SpriteAnchorMixin):
         # embedded url
         embedUrl = f"https://www.youtube.com/embed/{videoId}?rel=0"
 
+        # a decode still running for an earlier image must not replace the video
+        self._decodeToken += 1
+        self._pendingDecode = None
+
         self.lastURL = watchUrl
         self.titleLabel.setText(title)
 
@@ -369,50 +620,39 @@ class MediaViewWindow(InterfaceComponent, SpriteAnchorMixin):
         if openPanel:
             self.open()
 
-    def _buildiFrameHTML(self, iFrame: str) -> str:
-        return f"""
-            <!doctype html>
-                <html>
-                    <head>
-                        <meta charset="utf-8" />
-                        <meta name="viewport" content="width=device-width, initial-scale=1" />
-                        <style>
-                            html, body {{
-                            margin: 0;
-                            padding: 0;
-                            background: #000;
-                            width: 100%;
-                            height: 100%;
-                            overflow: hidden;
-                            }}
-                            .wrap {{
-                            position: absolute;
-                            inset: 0;
-                            }}
-                            iframe {{
-                            position: absolute;
-                            inset: 0;
-                            width: 100%;
-                            height: 100%;
-                            border: 0;
-                            }}
-                        </style>
-                    </head>
-                <body>
-                    <div class="wrap">{iFrame}</div>
-                </body>
-            </html>
+    def _ensureWebView(self) -> None:
+        """
+        create the web view in place of its placeholder, if it doesn't exist yet
         """
+        if self.webView is not None:
+            return
+
+        from PySide6.QtWebEngineWidgets import QWebEngineView
+
+        currentIndex = self.stack.currentIndex()
+
+        self.webView = QWebEngineView()
+        self.stack.removeWidget(self.webPlaceholder)
+        self.stack.insertWidget(self.WEB_PAGE_INDEX, self.webView)
+        self.stack.setCurrentIndex(currentIndex)
+
+        self.webPlaceholder.deleteLater()
+        self.webPlaceholder = None
+
+    def _buildiFrameHTML(self, iFrame: str) -> str:
+        return IFRAME_HTML_TEMPLATE.replace("{iframe}", iFrame)
 
     def _syncImageToViewport(self) -> None:
         self._resizeWindowToFitPixmap()
+
+        # a new image has no smooth size yet, so this starts the smooth pass right away
         self._applyScaledPixmap()
 
     def _resizeWindowToFitPixmap(self) -> None:
         if self.stack.currentIndex() != self.IMAGE_PAGE_INDEX:
             return
 
-        if not self.lastPixmap or self.lastPixmap.isNull():
+        if self._imageDims is None:
             return
 
         viewport = self.imageScroll.viewport().size()
@@ -427,8 +667,7 @@ class MediaViewWindow(InterfaceComponent, SpriteAnchorMixin):
         minViewWidth = max(1, MIN_SIZE.width() - chromeWidth)
         minViewHeight = max(1, MIN_SIZE.height() - chromeHeight)
 
-        imageWidth = self.lastPixmap.width()
-        imageHeight = self.lastPixmap.height()
+        imageWidth, imageHeight = self._imageDims
 
         if imageWidth <= 0 or imageHeight <= 0:
             return
@@ -449,19 +688,29 @@ class MediaViewWindow(InterfaceComponent, SpriteAnchorMixin):
         targetHeight = max(MIN_SIZE.height(), min(MAX_SIZE.height(), targetHeight))
 
         if targetWidth != self.width() or targetHeight != self.height():
-            self.resize(targetWidth, targetHeight)
-            self._reposition()
+            # the caller rescales once we're done, so the resize
+            # events this fires don't need to
+            self._duringProgrammaticResize = True
 
-    def _applyScaledPixmap(self) -> None:
+            try:
+                self.resize(targetWidth, targetHeight)
+                self._reposition()
+            finally:
+                self._duringProgrammaticResize = False
+
+    def _scaleTargetSize(self) -> Optional[QSize]:
         """
-        apply a scaled version of the current-set pixmap to the image label
+        get the viewport size the current pixmap should be scaled to
+
+        :return: the target size, or None if there is nothing to scale
+        :rtype: Optional[QSize]
         """
 
         if self.stack.currentIndex() != self.IMAGE_PAGE_INDEX:
-            return
+            return None
 
-        if not self.lastPixmap or self.lastPixmap.isNull():
-            return
+        if self._imageDims is None:
+            return None
 
         try:
             viewport = self.imageScroll.viewport().size()
@@ -469,12 +718,116 @@ class MediaViewWindow(InterfaceComponent, SpriteAnchorMixin):
             viewport = self.size()
 
         if viewport.width() <= 5 or viewport.height() <= 5:
+            return None
+
+        return viewport
+
+    def _applyScaledPixmap(self) -> None:
+        """
+        apply a quick preview scale of the current-set pixmap to the image label,
+        then start the smooth version now for big size jumps, or once resizing
+        settles for small ones
+        """
+
+        if self._duringProgrammaticResize:
+            return
+
+        viewport = self._scaleTargetSize()
+
+        if viewport is None:
+            return
+
+        key = (self._scaleMaster.cacheKey(), viewport.width(), viewport.height())
+        cached = self._scaledCache.get(key)
+
+        if cached is not None:
+            self._smoothScaleTimer.stop()
+            self._scaledCache.move_to_end(key)
+            self.imageLabel.setPixmap(cached)
+            return
+
+        preview = QPixmap.fromImage(
+            self._scaleMaster.scaled(
+                viewport,
+                Qt.KeepAspectRatio,
+                Qt.FastTransformation,
+            )
+        )
+
+        self.imageLabel.setPixmap(preview)
+
+        last = self._lastSmoothViewport
+
+        if last is not None:
+            delta = max(
+                abs(viewport.width() - last.width()) / viewport.width(),
+                abs(viewport.height() - last.height()) / viewport.height(),
+            )
+
+            if delta < SMOOTH_SCALE_JUMP:
+                self._smoothScaleTimer.start()
+                return
+
+        self._applySmoothScaledPixmap()
+
+    def _applySmoothScaledPixmap(self) -> None:
+        """
+        apply a smooth scaled version of the current-set pixmap to the image label,
+        scaling on the thread pool if it isn't cached yet
+        """
+
+        self._smoothScaleTimer.stop()
+        viewport = self._scaleTargetSize()
+
+        if viewport is None:
+            return
+
+        self._lastSmoothViewport = QSize(viewport)
+
+        key = (self._scaleMaster.cacheKey(), viewport.width(), viewport.height())
+        scaled = self._scaledCache.get(key)
+
+        if scaled is not None:
+            self._scaledCache.move_to_end(key)
+            self.imageLabel.setPixmap(scaled)
             return
 
-        scaled = self.lastPixmap.scaled(
-            viewport,
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation,
+        if key == self._pendingScaleKey:
+            return
+
+        self._scaleToken += 1
+        self._pendingScaleKey = key
+
+        image = self._scaleMaster
+        size = QSize(viewport)
+
+        task = _ImageTask(
+            self._scaleToken,
+            lambda: image.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation),
         )
 
+        self._startImageTask(task, self._onSmoothScaled)
+
+    def _onSmoothScaled(self, token: int, image: QImage) -> None:
+        if token != self._scaleToken:
+            return
+
+        key = self._pendingScaleKey
+        self._pendingScaleKey = None
+
+        if key is None or image.isNull():
+            return
+
+        # the image or viewport moved on while this was scaling
+        viewport = self._scaleTargetSize()
+
+        if viewport is None or key != (self._scaleMaster.cacheKey(), viewport.width(), viewport.height()):
+            return
+
+        scaled = QPixmap.fromImage(image)
+        self._scaledCache[key] = scaled
+
+        while len(self._scaledCache) > SCALED_CACHE_SIZE:
+            self._scaledCache.popitem(last=False)
+
         self.imageLabel.setPixmap(scaled)
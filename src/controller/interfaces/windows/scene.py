@@ -1,3 +1,4 @@
+from ..base.clickaway import sharedClickAwayFilter
 from ..base.anchor import SpriteAnchorMixin
 from ..base import InterfaceComponent
 
@@ -11,7 +12,7 @@ from ..base.lookskit import (
     SurfaceFrame,
     applyRockStyle,
     buildSpinboxRow,
-    makeIconSquare,
+    makeIconSquareImage,
 )
 
 from ..base.styling import (
@@ -28,20 +29,173 @@ from ...scene.system import SceneSystem
 from ...config import ConfigController
 from ...asset import AssetController
 
-from PySide6.QtCore import Qt, QEvent, QSize, QTimer
-from PySide6.QtGui import QColor, QIcon, QPixmap
+from PySide6.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSize,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+
+from PySide6.QtGui import QColor, QIcon, QImage, QPixmap
 
 from PySide6.QtWidgets import (
     QApplication,
     QHBoxLayout,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QVBoxLayout,
     QWidget,
 )
 
+from pathlib import Path
 from typing import Callable, Iterable, Optional
 
+REPOSITION_DEBOUNCE_MS = 16
+
+# shared placeholder for rows still loading and assets that fail to decode
+EMPTY_ICON = QIcon()
+
+TEXT_RGB = asRGB(TEXT_COLOR)
+HOVER_RGB = asRGB(QColor(BACKGROUND_COLOR).darker(106))
+
+# the scene window's stylesheet only depends on constants, so build it once
+SCENE_QSS = f"""
+    QLabel#sceneTitle {{
+        color: {TEXT_RGB};
+        padding: 0px;
+    }}
+
+    QListView#decorList {{
+        background: transparent;
+        border: none;
+        color: {TEXT_RGB};
+        outline: none;
+    }}
+
+    QListView#decorList::item {{
+        border-radius: 4px;
+        padding: 4px;
+    }}
+
+    QListView#decorList::item:selected {{
+        color: {TEXT_RGB};
+        background-color: {HOVER_RGB};
+        border: 1px solid {TEXT_RGB};
+    }}
+
+    QListView#decorList::item:hover {{
+        background-color: {HOVER_RGB};
+    }}
+"""
+
+class _IconTaskSignals(QObject):
+    finished = Signal(str, object, QImage)
+
+class _IconTask(QRunnable):
+    """
+    decodes and squares a decoration icon on the thread pool, the
+    result is handed back to the ui thread through a queued signal
+    """
+
+    def __init__(self, key: str, mtime: Optional[float]):
+        super().__init__()
+
+        self.key = key
+        self.mtime = mtime
+        self.signals = _IconTaskSignals()
+
+    def run(self) -> None:
+        try:
+            image = makeIconSquareImage(QImage(self.key))
+        except Exception:
+            image = QImage()
+
+        self.signals.finished.emit(self.key, self.mtime, image)
+
+class DecorListModel(QAbstractListModel):
+    """
+    list model over decoration asset paths, icons are only loaded when a view asks for them.
+    """
+
+    def __init__(self, iconLoader: Callable[[Path], Optional[QIcon]], parent=None):
+        """
+        initialise the decoration list model.
+
+        :param iconLoader: callable returning the list icon for a decoration path, or None while it is still loading
+        :type iconLoader: Callable[[Path], Optional[QIcon]]
+        """
+
+        super().__init__(parent)
+
+        self.iconLoader = iconLoader
+        self._paths: list[Path] = []
+        self._icons: list[Optional[QIcon]] = []
+        self._rows: dict[str, int] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return len(self._paths)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._paths)):
+            return None
+
+        row = index.row()
+
+        if role in (Qt.DisplayRole, Qt.UserRole):
+            return self._paths[row].stem
+
+        if role == Qt.DecorationRole:
+            # only rows that actually get painted end up here
+            if self._icons[row] is None:
+                # blank placeholder until setIcon delivers the decoded one
+                self._icons[row] = self.iconLoader(self._paths[row]) or EMPTY_ICON
+
+            return self._icons[row]
+
+        return None
+
+    def setPaths(self, paths: Iterable[Path]) -> None:
+        """
+        replace the decorations shown by the model.
+
+        :param paths: the decoration asset paths, in display order
+        :type paths: Iterable[Path]
+        """
+
+        self.beginResetModel()
+        self._paths = list(paths)
+        self._icons = [None] * len(self._paths)
+        self._rows = {str(path): row for row, path in enumerate(self._paths)}
+        self.endResetModel()
+
+    def setIcon(self, path: Path, icon: QIcon) -> None:
+        """
+        set the icon for a decoration once it has finished loading.
+
+        :param path: the decoration asset path
+        :type path: Path
+        :param icon: the loaded icon
+        :type icon: QIcon
+        """
+
+        row = self._rows.get(str(path))
+
+        if row is None:
+            return
+
+        self._icons[row] = icon
+
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
 class SceneWindowComponent(InterfaceComponent, SpriteAnchorMixin):
     """
     scene editor window for managing decorations and startup spawn count.
@@ -49,6 +203,9 @@ class SceneWindowComponent(InterfaceComponent, SpriteAnchorMixin):
     Provides decoration list, placement mode, and configuration persistence for scene items.
     """
 
+    # decoration path -> (mtime, icon), shared across windows and rebuilds
+    _iconCache: dict[str, tuple[float, QIcon]] = {}
+
     def __init__(
         self,
         sprite: QWidget,
@@ -97,6 +254,28 @@ class SceneWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         self._saveTimer.setSingleShot(True)
         self._saveTimer.setInterval(450)
         self._saveTimer.timeout.connect(self._saveConfigNow)
+
+        # coalesce sprite-move repositions into one anchor pass per frame
+        self._repositionTimer = QTimer(self)
+        self._repositionTimer.setSingleShot(True)
+        self._repositionTimer.setInterval(REPOSITION_DEBOUNCE_MS)
+        self._repositionTimer.timeout.connect(self._repositionNow)
+
+        # last (size, sprite, screen, occluders, visible) state the window was anchored against
+        self._lastRepositionKey = None
+
+        # (file name, mtime) of every asset the decoration list was built from
+        self._decorListSignature: Optional[tuple] = None
+
+        # decoration path -> icon decode running on the thread pool
+        self._pendingIcons: dict[str, _IconTask] = {}
+
+        # ids of the top-level windows hosting decoration viewports, refreshed on open
+        self._viewportWindowIds: set[int] = set()
+
+        # scene editor and viewports as of the last open, read by the click filter
+        self._editor = None
+        self._viewports: tuple = ()
     
     def build(self) -> None:
         """
@@ -143,11 +322,23 @@ class SceneWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         # decorations picker
         rootLayout.addWidget(BodyLabel("Add decorations", selectable=False))
 
-        self.decorList = QListWidget()
+        self.decorModel = DecorListModel(self._getDecorIcon, self)
+
+        self.decorList = QListView()
         self.decorList.setObjectName("decorList")
+        # rows take the view's font, the model leaves FontRole unset
+        self.decorList.setFont(DEFAULT_FONT)
         self.decorList.setIconSize(QSize(32, 32))
         self.decorList.setSpacing(2)
-        self.decorList.itemDoubleClicked.connect(self._placeSelected)
+        self.decorList.setEditTriggers(QListView.NoEditTriggers)
+
+        # every row is a 32px icon and one line of text
+        self.decorList.setUniformItemSizes(True)
+        self.decorList.setLayoutMode(QListView.Batched)
+        self.decorList.setBatchSize(32)
+
+        self.decorList.setModel(self.decorModel)
+        self.decorList.doubleClicked.connect(self._placeSelected)
         rootLayout.addWidget(self.decorList)
 
         buttonsRow = QWidget()
@@ -168,38 +359,7 @@ class SceneWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         rootLayout.addWidget(self.helpLabel)
 
         # style
-        onHoverBackground = QColor(BACKGROUND_COLOR).darker(106)
-        applyRockStyle(
-            self,
-            extraQss=f"""
-            QLabel#sceneTitle {{
-                color: {asRGB(TEXT_COLOR)};
-                padding: 0px;
-            }}
-
-            QListWidget#decorList {{
-                background: transparent;
-                border: none;
-                color: {asRGB(TEXT_COLOR)};
-                outline: none;
-            }}
-
-            QListWidget#decorList::item {{
-                border-radius: 4px;
-                padding: 4px;
-            }}
-
-            QListWidget#decorList::item:selected {{
-                color: {asRGB(TEXT_COLOR)};
-                background-color: {asRGB(onHoverBackground)};
-                border: 1px solid {asRGB(TEXT_COLOR)};
-            }}
-
-            QListWidget#decorList::item:hover {{
-                background-color: {asRGB(onHoverBackground)};
-            }}
-            """,
-        )
+        applyRockStyle(self, extraQss=SCENE_QSS)
 
         self._populateDecorList()
         self._syncFromConfig()
@@ -209,27 +369,101 @@ class SceneWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         populate the decoration list from available decoration assets.
         """
 
-        self.decorList.clear()
+        # build items from assets (already sorted)
+        assets = self.decorAssetController.listDirectory("")
 
-        # build items from assets
-        assets = sorted(
-            [p for p in self.decorAssetController.listDirectory("")]
-        )
+        signature = []
 
         for path in assets:
-            name = str(path.stem)
-            pixmap = QPixmap(str(path))
-            icon = makeIconSquare(pixmap)
-
-            item = QListWidgetItem(icon, name)
-            item.setData(Qt.UserRole, name)
-            item.setFont(DEFAULT_FONT)
-            self.decorList.addItem(item)
-
-        # select first by default
-        if self.decorList.count() > 0 and self.decorList.currentRow() < 0:
-            self.decorList.setCurrentRow(0)
-    
+            try:
+                signature.append((path.name, path.stat().st_mtime))
+            except OSError:
+                signature.append((path.name, None))
+
+        signature = tuple(signature)
+
+        # nothing was added, removed or touched since the last build
+        if signature == self._decorListSignature:
+            return
+
+        self._decorListSignature = signature
+
+        # one repaint for the whole rebuild
+        self.decorList.setUpdatesEnabled(False)
+
+        try:
+            self.decorModel.setPaths(assets)
+
+            # select first by default
+            if self.decorModel.rowCount() > 0 and not self.decorList.currentIndex().isValid():
+                self.decorList.setCurrentIndex(self.decorModel.index(0, 0))
+        finally:
+            self.decorList.setUpdatesEnabled(True)
+
+    def _getDecorIcon(self, path: Path) -> Optional[QIcon]:
+        """
+        get the list icon for a decoration, decoding it on the thread pool if the file changed.
+
+        :param path: the decoration image path
+        :type path: Path
+        :return: the square icon for the decoration, or None while it is being decoded
+        :rtype: Optional[QIcon]
+        """
+
+        key = str(path)
+
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            mtime = None
+
+        cached = self._iconCache.get(key)
+
+        if (cached is not None) and (mtime is not None) and (cached[0] == mtime):
+            return cached[1]
+
+        if key not in self._pendingIcons:
+            self._startIconTask(_IconTask(key, mtime))
+
+        return None
+
+    def _startIconTask(self, task: _IconTask) -> None:
+        """
+        start an icon decode on the global thread pool.
+
+        :param task: the task to run
+        :type task: _IconTask
+        """
+
+        # keep the task (and its signals object) alive until it reports back,
+        # the pool still deletes the runnable itself once it has run
+        self._pendingIcons[task.key] = task
+
+        task.signals.finished.connect(self._onIconDecoded, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(task)
+
+    def _onIconDecoded(self, key: str, mtime: Optional[float], image: QImage) -> None:
+        """
+        turn a decoded icon image into a QIcon and hand it to the list.
+
+        :param key: the decoration image path
+        :type key: str
+        :param mtime: the file mtime the decode started with
+        :type mtime: Optional[float]
+        :param image: the squared icon image, null if decoding failed
+        :type image: QImage
+        """
+
+        self._pendingIcons.pop(key, None)
+
+        # QPixmap has to be built on the ui thread
+        icon = QIcon(QPixmap.fromImage(image)) if not image.isNull() else EMPTY_ICON
+
+        if mtime is not None:
+            self._iconCache[key] = (mtime, icon)
+
+        self.decorModel.setIcon(Path(key), icon)
+
     def _syncFromConfig(self) -> None:
         """
         synchronise the spawn count spinbox with current configuration.
@@ -264,12 +498,12 @@ class SceneWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         begin placement mode for the currently selected decoration.
         """
 
-        item = self.decorList.currentItem()
+        index = self.decorList.currentIndex()
     
-        if item is None:
+        if not index.isValid():
             return
 
-        name = item.data(Qt.UserRole) or item.text()
+        name = index.data(Qt.UserRole)
 
         if not name:
             return
@@ -297,20 +531,51 @@ class SceneWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         """
 
         try:
-            self.config.saveConfig()
+            self.config.saveConfigAsync()
         except Exception:
             pass
 
     def _reposition(self):
+        """
+        schedule a reposition, applied at most once per frame while visible.
+        """
+
+        # opening needs the position before the first show
+        if not self.isVisible():
+            self._repositionTimer.stop()
+            self._repositionNow()
+            return
+
+        if not self._repositionTimer.isActive():
+            self._repositionTimer.start()
+
+    def _repositionNow(self):
         """
         reposition the window anchored to the sprite with appropriate margins.
         """
 
+        occluders = self.getOccluderBounds(self.occludersProvider)
+
+        # nothing that affects the anchor moved since last time,
+        # so the target would be identical
+        key = (
+            self.size().toTuple(),
+            self.spriteFrameGeometry().getRect(),
+            self.spriteAvailableGeometry().getRect(),
+            tuple(rect.getRect() for rect in occluders),
+            self.isVisible(),
+        )
+
+        if key == self._lastRepositionKey:
+            return
+
+        self._lastRepositionKey = key
+
         target = self.anchorNextToSprite(
             yAlign="bottom",
             preferredSide="right",
             margin=BORDER_MARGIN,
-            occludersProvider=self.occludersProvider,
+            occluders=occluders,
         )
 
         self.animateTo(target)
@@ -325,19 +590,23 @@ class SceneWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         :rtype: bool
         """
 
-        if (not self.isVisible()) or (not self.sprite):
+        if event.type() != QEvent.MouseButtonPress:
             return False
 
-        if event.type() != QEvent.MouseButtonPress:
+        if (not self.isVisible()) or (not self.sprite):
             return False
 
-        try:
-            if self.decorations.editor.canEdit:
-                return False
-        except Exception:
-            pass
+        editor = self._editor
+
+        if (editor is not None) and editor.canEdit:
+            return False
 
         globalPos = event.globalPos()
+
+        # clicks on ourselves or the sprite never close, skip the hit-test walk
+        if self.frameGeometry().contains(globalPos) or self.spriteFrameGeometry().contains(globalPos):
+            return False
+
         widget = QApplication.widgetAt(globalPos)
 
         # when the sprite loses focus: close
@@ -355,7 +624,10 @@ class SceneWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         try:
             window = widget.window()
 
-            for viewport in getattr(self.decorations, "viewports", []):
+            if id(window) in self._viewportWindowIds:
+                return False
+
+            for viewport in self._viewports:
                 if (window is viewport) or (widget is viewport) or viewport.isAncestorOf(widget):
                     return False
 
@@ -372,9 +644,29 @@ class SceneWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         """
 
         super().open()
+        self._populateDecorList()
         self._syncFromConfig()
+        self._refreshViewportWindows()
         self.decorations.setEditMode(True)
-        QApplication.instance().installEventFilter(self)
+        sharedClickAwayFilter().register(self)
+
+    def _refreshViewportWindows(self) -> None:
+        """
+        snapshot the scene editor and viewports, and which top-level windows host them.
+        """
+
+        self._editor = getattr(self.decorations, "editor", None)
+        self._viewports = tuple(getattr(self.decorations, "viewports", ()))
+
+        windowIds = set()
+
+        for viewport in self._viewports:
+            try:
+                windowIds.add(id(viewport.window()))
+            except Exception:
+                pass
+
+        self._viewportWindowIds = windowIds
 
     def hideEvent(self, event) -> None:
         """
@@ -394,10 +686,8 @@ class SceneWindowComponent(InterfaceComponent, SpriteAnchorMixin):
             except Exception:
                 pass
 
-            try:
-                QApplication.instance().removeEventFilter(self)
-            except Exception:
-                pass
+            sharedClickAwayFilter().unregister(self)
+            self._repositionTimer.stop()
         finally:
             super().hideEvent(event)
         
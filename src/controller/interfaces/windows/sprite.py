@@ -1,3 +1,4 @@
+from ..base.clickaway import sharedClickAwayFilter
 from ..base.anchor import SpriteAnchorMixin
 from ..base import InterfaceComponent
 
@@ -26,7 +27,7 @@ from ..base.styling import (
 
 from ...config import ConfigController
 
-from PySide6.QtCore import Qt, QEvent, QTimer
+from PySide6.QtCore import Qt, QEvent, QSignalBlocker, QTimer
 from PySide6.QtGui import QColor
 
 from PySide6.QtWidgets import (
@@ -36,10 +37,52 @@ from PySide6.QtWidgets import (
     QWidget
 )
 
-from typing import Callable, Iterable, Optional
+from functools import partial
+from typing import Any, Callable, Iterable, Optional
 
-def clamp(value: float, minVal: float = 0.0, maxVal: float = 1.0) -> float:
-    return max(minVal, min(maxVal, float(value)))
+# save debounce fallbacks when the config does not set them
+SAVE_DEBOUNCE_BURST_MS = 450
+SAVE_DEBOUNCE_DISCRETE_MS = 150
+
+# (label, settings key, spinbox attribute) for each refresh rate row
+REFRESH_RATE_ROWS = (
+    ("Primary Loop", "primaryLoop", "_primaryLoopSpinBox"),
+    ("Secondary Loop", "secondaryLoop", "_secondaryLoopSpinBox"),
+)
+
+TEXT_RGB = asRGB(TEXT_COLOR)
+HOVER_RGB = asRGB(QColor(BACKGROUND_COLOR).darker(106))
+
+# the sprite window's stylesheet only depends on constants, so build it once
+SPRITE_QSS = f"""
+    QLabel#spriteTitle {{
+        color: {TEXT_RGB};
+        padding: 0px;
+    }}
+
+    QSlider::groove:horizontal {{
+        height: {PADDING // 2}px;
+        background: rgba(0, 0, 0, 25);
+        border-radius: 3px;
+    }}
+
+    QSlider::sub-page:horizontal {{
+        background: rgba({TEXT_COLOR.red()}, {TEXT_COLOR.green()}, {TEXT_COLOR.blue()}, 120);
+        border-radius: 3px;
+    }}
+
+    QSlider::handle:horizontal {{
+        width: 14px;
+        margin: -5px 0px;
+        border-radius: 7px;
+        background: rgba(255, 255, 255, 200);
+        border: 1px solid rgba(0, 0, 0, 40);
+    }}
+
+    QSlider::handle:horizontal:hover {{
+        background: {HOVER_RGB};
+    }}
+"""
 
 class SpriteWindowComponent(InterfaceComponent, SpriteAnchorMixin):
     """
@@ -48,6 +91,19 @@ class SpriteWindowComponent(InterfaceComponent, SpriteAnchorMixin):
     Provides sliders and inputs for configuring sprite display and timing parameters with debounced config persistence.
     """
 
+    # settings key -> (config path, optional value transform)
+    _KEY_MAP: dict[str, tuple[str, Optional[Callable]]] = {
+        "userNick": ("sprite.userNick", None),
+        "hat": ("sprite.hat", lambda value: "" if value == "none" else value),
+        "primaryLoop": ("sprite.refreshRates.primaryLoop", None),
+        "secondaryLoop": ("sprite.refreshRates.secondaryLoop", None),
+        "preferMetric": ("location.preferMetric", None),
+        "allowedGeoIpFetch": ("location.allowedGeoIpFetch", None),
+    }
+
+    # keys whose controls emit a change per keystroke
+    _BURST_KEYS = frozenset({"userNick"})
+
     def __init__(
         self,
         sprite: QWidget,
@@ -88,8 +144,25 @@ class SpriteWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         # debounce config writes
         self._saveTimer = QTimer(self)
         self._saveTimer.setSingleShot(True)
-        self._saveTimer.setInterval(450)
-        self._saveTimer.timeout.connect(self._saveConfigNow)
+        self._saveTimer.setInterval(SAVE_DEBOUNCE_BURST_MS)
+        # everything here lives on the ui thread, skip AutoConnection's thread check
+        self._saveTimer.timeout.connect(self._saveConfigNow, Qt.DirectConnection)
+
+        # typing waits longer for a pause than one-off clicks do
+        debounce = self.config.getValues([
+            "config.saveDebounceMs.burst",
+            "config.saveDebounceMs.discrete",
+        ])
+
+        try:
+            self._burstSaveDelay = int(debounce.get("config.saveDebounceMs.burst", SAVE_DEBOUNCE_BURST_MS))
+            self._discreteSaveDelay = int(debounce.get("config.saveDebounceMs.discrete", SAVE_DEBOUNCE_DISCRETE_MS))
+        except (TypeError, ValueError):
+            self._burstSaveDelay = SAVE_DEBOUNCE_BURST_MS
+            self._discreteSaveDelay = SAVE_DEBOUNCE_DISCRETE_MS
+
+        # config generation the controls were last synced from
+        self._lastSyncGeneration = -1
 
     def build(self) -> None:
         """
@@ -124,7 +197,7 @@ class SpriteWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         # User Nickname
         nickRow, self._nickEdit = buildTextInputRow(
             "User Nickname",
-            onChanged=lambda text: self._applyKeyValue("userNick", text),
+            onChanged=partial(self._applyKeyValue, "userNick"),
         )
         rootLayout.addWidget(nickRow)
         rootLayout.addWidget(Divider())
@@ -133,9 +206,12 @@ class SpriteWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         hatRow, self.hatDropdown = buildDropdownRow(
             "Hat",
             items=self.sprite.allHats,
-            onChanged=lambda text: self._applyKeyValue("hat", text),
+            onChanged=partial(self._applyKeyValue, "hat"),
         )
         rootLayout.addWidget(hatRow)
+
+        # the dropdown never swaps its view, so the click filter can keep a reference
+        self._hatPopupView = self.hatDropdown.view()
         rootLayout.addWidget(Divider())
 
         # Scale slider
@@ -144,83 +220,44 @@ class SpriteWindowComponent(InterfaceComponent, SpriteAnchorMixin):
             minScale=0.25,
             maxScale=2.0,
             onChanged=None,
-            onReleased=lambda scale: self._applyKeyValue("scale", scale),
+            onReleased=partial(self._applyKeyValue, "scale"),
         )
         rootLayout.addWidget(scaleRow)
         rootLayout.addWidget(Divider())
 
         # Refresh Rates
         rootLayout.addWidget(BodyLabel("Refresh Rates", selectable=False))
-        primaryRow, self._primaryLoopSpinBox = buildSpinboxRow(
-            "Primary Loop",
-            minValue=1,
-            maxValue=240,
-            step=1,
-            suffix=" Hz",
-            onChanged=lambda v: self._applyKeyValue("primaryLoop", v),
-        )
-        rootLayout.addWidget(primaryRow)
-        secondaryRow, self._secondaryLoopSpinBox = buildSpinboxRow(
-            "Secondary Loop",
-            minValue=1,
-            maxValue=240,
-            step=1,
-            suffix=" Hz",
-            onChanged=lambda v: self._applyKeyValue("secondaryLoop", v),
-        )
-        rootLayout.addWidget(secondaryRow)
+        for (label, key, attribute) in REFRESH_RATE_ROWS:
+            loopRow, loopSpinBox = buildSpinboxRow(
+                label,
+                minValue=1,
+                maxValue=240,
+                step=1,
+                suffix=" Hz",
+                onChanged=partial(self._applyKeyValue, key),
+            )
+
+            setattr(self, attribute, loopSpinBox)
+            rootLayout.addWidget(loopRow)
+
         rootLayout.addWidget(Divider())
 
         # preferences
         rootLayout.addWidget(BodyLabel("Preferences", selectable=False))
         preferMetricRow, self._preferMetricSwitch, self._preferMetricStateLabel = buildSwitchRow(
             "Prefer Metric",
-            onChanged=lambda v: self._applyKeyValue("preferMetric", v),
+            onChanged=partial(self._applyKeyValue, "preferMetric"),
         )
         rootLayout.addWidget(preferMetricRow)
 
         geoIpRow, self._geoIpSwitch, self._geoIpStateLabel = buildSwitchRow(
             "GeoIP fetching",
-            onChanged=lambda v: self._applyKeyValue("allowedGeoIpFetch", v),
+            onChanged=partial(self._applyKeyValue, "allowedGeoIpFetch"),
         )
         rootLayout.addWidget(geoIpRow)
 
         # style
-        onHoverBackground = QColor(BACKGROUND_COLOR).darker(106)
-        applyRockStyle(
-            self,
-            extraQss=f"""
-            QLabel#spriteTitle {{
-                color: {asRGB(TEXT_COLOR)};
-                padding: 0px;
-            }}
-
-            QSlider::groove:horizontal {{
-                height: {PADDING // 2}px;
-                background: rgba(0, 0, 0, 25);
-                border-radius: 3px;
-            }}
-
-            QSlider::sub-page:horizontal {{
-                background: rgba({TEXT_COLOR.red()}, {TEXT_COLOR.green()}, {TEXT_COLOR.blue()}, 120);
-                border-radius: 3px;
-            }}
-
-            QSlider::handle:horizontal {{
-                width: 14px;
-                margin: -5px 0px;
-                border-radius: 7px;
-                background: rgba(255, 255, 255, 200);
-                border: 1px solid rgba(0, 0, 0, 40);
-            }}
-
-            QSlider::handle:horizontal:hover {{
-                background: {asRGB(onHoverBackground)};
-            }}
-            """,
-        )
-
-        self._syncFromConfig()
+        applyRockStyle(self, extraQss=SPRITE_QSS)
 
     def _applyKeyValue(self, key: str, value) -> None:
         """
@@ -231,32 +268,64 @@ class SpriteWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         :param value: the new value to set
         """
 
-        if key == "userNick":
-            self.config.setValue("sprite.userNick", value)
-        elif key == "hat":
-            self.config.setValue("sprite.hat", "" if value == "none" else value)
-        elif key == "scale":
-            scale = clamp(value, 0.25, 2.0)
+        if key == "scale":
+            # scale also needs its label kept in step
+            scale = float(value)
+            scale = 2.0 if scale > 2.0 else (0.25 if scale < 0.25 else scale)
+
+            if self._currentValue("sprite.scale") == scale:
+                return
+
             self.config.setValue("sprite.scale", scale)
-            self._scaleLabel.setText(f"{scale:.2f}x")
-        elif key == "primaryLoop":
-            self.config.setValue("sprite.refreshRates.primaryLoop", value)
-        elif key == "secondaryLoop":
-            self.config.setValue("sprite.refreshRates.secondaryLoop", value)
-        elif key == "preferMetric":
-            self.config.setValue("location.preferMetric", value)
-        elif key == "allowedGeoIpFetch":
-            self.config.setValue("location.allowedGeoIpFetch", value)
-
-        self._scheduleSave()
-
-    def _scheduleSave(self) -> None:
+
+            # releases often land on the value the label already shows
+            text = f"{scale:.2f}x"
+
+            if self._scaleLabel.text() != text:
+                self._scaleLabel.setText(text)
+        else:
+            entry = self._KEY_MAP.get(key)
+
+            if entry is None:
+                return
+
+            path, transform = entry
+            value = transform(value) if transform else value
+
+            # no-op edit, nothing to write or save
+            if self._currentValue(path) == value:
+                return
+
+            self.config.setValue(path, value)
+
+        self._scheduleSave(burst=(key in self._BURST_KEYS))
+
+    def _currentValue(self, path: str) -> Any:
+        """
+        get the current config value for a path.
+        
+        :param path: the config path to look up
+        :type path: str
+        :return: the stored value, or None if the path does not exist
+        :rtype: Any
+        """
+
+        try:
+            return self.config.getValue(path)
+        except KeyError:
+            return None
+
+    def _scheduleSave(self, burst: bool = True) -> None:
         """
         schedule a debounced config save operation.
+        
+        :param burst: whether the edit comes from a control that fires in bursts, like typing
+        :type burst: bool
         """
 
-        # restart debounce timer
-        self._saveTimer.stop()
+        self._saveTimer.setInterval(self._burstSaveDelay if burst else self._discreteSaveDelay)
+
+        # start() on a running timer restarts it, no need to stop first
         self._saveTimer.start()
 
     def _saveConfigNow(self) -> None:
@@ -265,7 +334,7 @@ class SpriteWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         """
 
         try:
-            self.config.saveConfig()
+            self.config.saveConfigAsync()
         except Exception:
             pass
 
@@ -274,82 +343,74 @@ class SpriteWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         synchronise ui controls with current configuration values.
         """
 
+        values = self.config.getValues([
+            "sprite.userNick",
+            "sprite.hat",
+            "sprite.scale",
+            "sprite.refreshRates.primaryLoop",
+            "sprite.refreshRates.secondaryLoop",
+            "location.preferMetric",
+            "location.allowedGeoIpFetch",
+        ])
+
         # user nickname
-        try:
-            userNick = str(self.config.getValue("sprite.userNick"))
-        except Exception:
-            userNick = "<USERNAME>"
+        userNick = str(values.get("sprite.userNick", "<USERNAME>"))
 
-        self._nickEdit.blockSignals(True)
-        self._nickEdit.setText(userNick)
-        self._nickEdit.blockSignals(False)
+        with QSignalBlocker(self._nickEdit):
+            self._nickEdit.setText(userNick)
 
         # hat
-        try:
-            hat = str(self.config.getValue("sprite.hat"))
-            if not hat:
-                hat = "None"
-        except Exception:
-            hat = "None"
-
-        self.hatDropdown.blockSignals(True)
-        index = self.hatDropdown.findText(hat)
+        hat = str(values.get("sprite.hat") or "None")
 
-        if index >= 0:
-            self.hatDropdown.setCurrentIndex(index)
+        with QSignalBlocker(self.hatDropdown):
+            index = self.hatDropdown.findText(hat)
 
-        self.hatDropdown.blockSignals(False)
+            if index >= 0:
+                self.hatDropdown.setCurrentIndex(index)
 
         # scale
         try:
-            scale = clamp(self.config.getValue("sprite.scale"), 0.25, 2.0)
-        except Exception:
+            scale = float(values.get("sprite.scale", 0.75))
+            scale = 2.0 if scale > 2.0 else (0.25 if scale < 0.25 else scale)
+        except (TypeError, ValueError):
             scale = 0.75
 
-        self._scaleSlider.blockSignals(True)
-        self._scaleSlider.setValue(int(round(scale * 100)))
-        self._scaleSlider.blockSignals(False)
+        with QSignalBlocker(self._scaleSlider):
+            self._scaleSlider.setValue(int(scale * 100 + 0.5))
+
         self._scaleLabel.setText(f"{scale:.2f}x")
 
         # refresh rates
         try:
-            primaryLoop = int(self.config.getValue("sprite.refreshRates.primaryLoop"))
-        except Exception:
+            primaryLoop = int(values.get("sprite.refreshRates.primaryLoop", 30))
+        except (TypeError, ValueError):
             primaryLoop = 30
 
         try:
-            secondaryLoop = int(self.config.getValue("sprite.refreshRates.secondaryLoop"))
-        except Exception:
+            secondaryLoop = int(values.get("sprite.refreshRates.secondaryLoop", 15))
+        except (TypeError, ValueError):
             secondaryLoop = 15
 
-        self._primaryLoopSpinBox.blockSignals(True)
-        self._primaryLoopSpinBox.setValue(primaryLoop)
-        self._primaryLoopSpinBox.blockSignals(False)
+        with QSignalBlocker(self._primaryLoopSpinBox):
+            self._primaryLoopSpinBox.setValue(primaryLoop)
 
-        self._secondaryLoopSpinBox.blockSignals(True)
-        self._secondaryLoopSpinBox.setValue(secondaryLoop)
-        self._secondaryLoopSpinBox.blockSignals(False)
+        with QSignalBlocker(self._secondaryLoopSpinBox):
+            self._secondaryLoopSpinBox.setValue(secondaryLoop)
 
         # preferences
-        try:
-            preferMetric = bool(self.config.getValue("location.preferMetric"))
-        except Exception:
-            preferMetric = True
+        preferMetric = bool(values.get("location.preferMetric", True))
 
-        self._preferMetricSwitch.blockSignals(True)
-        self._preferMetricSwitch.setChecked(preferMetric)
-        self._preferMetricStateLabel.setText("enabled" if preferMetric else "disabled")
-        self._preferMetricSwitch.blockSignals(False)
+        with QSignalBlocker(self._preferMetricSwitch):
+            self._preferMetricSwitch.setChecked(preferMetric)
+            self._preferMetricStateLabel.setText("enabled" if preferMetric else "disabled")
 
-        try:
-            allowedGeoIpFetch = bool(self.config.getValue("location.allowedGeoIpFetch"))
-        except Exception:
-            allowedGeoIpFetch = False
+        allowedGeoIpFetch = bool(values.get("location.allowedGeoIpFetch", False))
 
-        self._geoIpSwitch.blockSignals(True)
-        self._geoIpSwitch.setChecked(allowedGeoIpFetch)
-        self._geoIpStateLabel.setText("enabled" if allowedGeoIpFetch else "disabled")
-        self._geoIpSwitch.blockSignals(False)
+        with QSignalBlocker(self._geoIpSwitch):
+            self._geoIpSwitch.setChecked(allowedGeoIpFetch)
+            self._geoIpStateLabel.setText("enabled" if allowedGeoIpFetch else "disabled")
+
+        self._lastSyncGeneration = self.config.generation
 
     def _reposition(self):
         """
@@ -375,17 +436,36 @@ class SpriteWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         :rtype: bool
         """
 
-        if (not self.isVisible()) or (not self.sprite):
+        eventType = event.type()
+
+        if (eventType != QEvent.MouseButtonPress) and (eventType != QEvent.ApplicationDeactivate):
             return False
 
-        if event.type() == QEvent.ApplicationDeactivate:
-            self.close()
+        sprite = self.sprite
+
+        if (not self.isVisible()) or (not sprite):
             return False
 
-        if event.type() != QEvent.MouseButtonPress:
+        # still fading in from (or out to) fully transparent, nothing to click away from yet
+        if self._fadeable_currentOpacity() < 0.01:
+            return False
+
+        if eventType == QEvent.ApplicationDeactivate:
+            self.close()
             return False
 
         globalPos = event.globalPos()
+
+        # clicks on ourselves or the sprite never close, skip the hit-test walk
+        if self.frameGeometry().contains(globalPos) or self.spriteFrameGeometry().contains(globalPos):
+            return False
+
+        # the open hat popup handles its own outside clicks
+        popupView = self._hatPopupView
+
+        if popupView is not None and popupView.isVisible():
+            return False
+
         widget = QApplication.widgetAt(globalPos)
 
         if widget is None:
@@ -395,10 +475,10 @@ class SpriteWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         if (widget is self) or (self.isAncestorOf(widget)):
             return False
 
-        if (widget is self.sprite) or (self.sprite.isAncestorOf(widget)):
+        if (widget is sprite) or (sprite.isAncestorOf(widget)):
             return False
 
-        if self.hatDropdown.isAncestorOf(widget) or (self.hatDropdown.view() and self.hatDropdown.view().isVisible()):
+        if self.hatDropdown.isAncestorOf(widget):
             return False
 
         self.close()
@@ -409,9 +489,15 @@ class SpriteWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         open the settings window and sync controls from config.
         """
 
+        # widgets are built on first open, sync them once before showing
+        self.ensureBuilt()
+
+        # controls still match the config from last time
+        if self.config.generation != self._lastSyncGeneration:
+            self._syncFromConfig()
+
         super().open()
-        self._syncFromConfig()
-        QApplication.instance().installEventFilter(self)
+        sharedClickAwayFilter().register(self)
 
     def hideEvent(self, event) -> None:
         """
@@ -421,6 +507,6 @@ class SpriteWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         """
 
         try:
-            QApplication.instance().removeEventFilter(self)
+            sharedClickAwayFilter().unregister(self)
         finally:
             super().hideEvent(event)
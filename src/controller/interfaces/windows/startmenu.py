@@ -1,5 +1,6 @@
 from ...system.timings import TimingClock
 
+from ..base.clickaway import sharedClickAwayFilter
 from ..base.anchor import SpriteAnchorMixin
 from ..base import InterfaceComponent
 
@@ -16,8 +17,20 @@ from ..base.styling import (
 
 from ..base.lookskit import SubheadingLabel, SurfaceFrame, applyRockStyle
 
-from PySide6.QtCore import Qt, QPoint, QSize, QEvent, QRect, QTimer
-from PySide6.QtGui import QIcon, QColor
+from PySide6.QtCore import (
+    Qt,
+    QEvent,
+    QObject,
+    QPoint,
+    QRect,
+    QRunnable,
+    QSize,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+
+from PySide6.QtGui import QIcon, QColor, QImage, QPixmap
 
 from PySide6.QtWidgets import (
     QAbstractItemView,
@@ -33,6 +46,61 @@ from dataclasses import dataclass
 
 SIZE_CONSTRAINTS = (196, 512)
 
+# item role holding the icon path while the icon itself is still loading
+ICON_PATH_ROLE = Qt.UserRole + 1
+
+# the menu's stylesheet only depends on constants, so build it once
+MENU_QSS = f"""
+    QLabel#menuTitle {{
+        color: {asRGB(TEXT_COLOR)};
+        padding: 0px;
+    }}
+
+    QListWidget#menuList {{
+        background: transparent;
+        border: none;
+        color: {asRGB(TEXT_COLOR)};
+        outline: none;
+    }}
+
+    QListWidget#menuList::item {{
+        border-radius: {BORDER_RADIUS}px;
+        padding: 0px;
+        min-height: {DEFAULT_FONT.pointSize()}px;
+    }}
+
+    QListWidget#menuList::item:hover {{
+        background-color: {asRGB(QColor(BACKGROUND_COLOR).darker(106))};
+    }}
+
+    QListWidget#menuList::item:selected {{
+        background-color: {asRGB(QColor(BACKGROUND_COLOR).darker(112))};
+    }}
+"""
+
+class _IconTaskSignals(QObject):
+    finished = Signal(str, QImage)
+
+class _IconTask(QRunnable):
+    """
+    decodes a menu icon on the thread pool, the result is handed
+    back to the ui thread through a queued signal
+    """
+
+    def __init__(self, key: str):
+        super().__init__()
+
+        self.key = key
+        self.signals = _IconTaskSignals()
+
+    def run(self) -> None:
+        try:
+            image = QImage(self.key)
+        except Exception:
+            image = QImage()
+
+        self.signals.finished.emit(self.key, image)
+
 @dataclass
 class MenuAction:
     name: str
@@ -75,6 +143,21 @@ class StartMenuComponent(InterfaceComponent, SpriteAnchorMixin):
         self.actions = list(actions)
         self.occludersProvider = occludersProvider
 
+        # action name -> action, so clicks do not scan the list
+        self._actionByName = {action.name: action for action in self.actions}
+
+        # measured height of one list row, None until the next measurement
+        self._rowHeight: Optional[int] = None
+
+        # coalesce size recomputes requested within one event loop pass
+        self._recomputeTimer = QTimer(self)
+        self._recomputeTimer.setSingleShot(True)
+        self._recomputeTimer.setInterval(0)
+        self._recomputeTimer.timeout.connect(self._recomputeHeightSnap)
+
+        # icon decodes still running on the thread pool, by path
+        self._pendingIcons: dict[str, _IconTask] = {}
+
         self.setWindowFlags(
             Qt.Tool |
             Qt.FramelessWindowHint |
@@ -117,6 +200,7 @@ class StartMenuComponent(InterfaceComponent, SpriteAnchorMixin):
         self.listWidget.setSelectionMode(QAbstractItemView.SingleSelection)
         self.listWidget.setIconSize(QSize(16, 16))
         self.listWidget.setSpacing(0)
+        self.listWidget.setUniformItemSizes(True)
 
         for action in self.actions:
             item = QListWidgetItem(action.label)
@@ -124,48 +208,86 @@ class StartMenuComponent(InterfaceComponent, SpriteAnchorMixin):
 
             if action.iconName:
                 path = ICON_ASSETS.blindGetAsset(action.iconName)
-                item.setIcon(QIcon(str(path)))
+
+                if path is not None:
+                    self._setItemIcon(item, str(path))
 
             self.listWidget.addItem(item)
 
+        # rows are only created here, so the width is measured once, on the first open
+        self._widthDirty = True
+
         self.listWidget.itemClicked.connect(self._onClicked)
 
         self.rootLayout.addWidget(self.titleLabel)
         self.rootLayout.addWidget(self.listWidget)
 
-        onHoverBackground = QColor(BACKGROUND_COLOR).darker(106)
-        onSelectBackground = QColor(BACKGROUND_COLOR).darker(112)
-
-        applyRockStyle(
-            self,
-            extraQss=f"""
-            QLabel#menuTitle {{
-                color: {asRGB(TEXT_COLOR)};
-                padding: 0px;
-            }}
-
-            QListWidget#menuList {{
-                background: transparent;
-                border: none;
-                color: {asRGB(TEXT_COLOR)};
-                outline: none;
-            }}
-
-            QListWidget#menuList::item {{
-                border-radius: {BORDER_RADIUS}px;
-                padding: 0px;
-                min-height: {DEFAULT_FONT.pointSize()}px;
-            }}
-
-            QListWidget#menuList::item:hover {{
-                background-color: {asRGB(onHoverBackground)};
-            }}
-
-            QListWidget#menuList::item:selected {{
-                background-color: {asRGB(onSelectBackground)};
-            }}
-            """,
-        )
+        applyRockStyle(self, extraQss=MENU_QSS)
+
+    def _setItemIcon(self, item: QListWidgetItem, key: str) -> None:
+        """
+        give an item its icon, decoding it off the ui thread.
+
+        :param item: the list item to update
+        :type item: QListWidgetItem
+        :param key: the icon file path
+        :type key: str
+        """
+
+        item.setData(ICON_PATH_ROLE, key)
+
+        # actions sharing an icon file share one decode
+        if key in self._pendingIcons:
+            return
+
+        task = _IconTask(key)
+
+        # keep the task (and its signals object) alive until it reports back,
+        # the pool still deletes the runnable itself once it has run
+        self._pendingIcons[key] = task
+
+        task.signals.finished.connect(self._onIconDecoded, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(task)
+
+    def _onIconDecoded(self, key: str, image: QImage) -> None:
+        """
+        turn a decoded icon image into a QIcon and hand it to every item using it.
+
+        :param key: the icon file path
+        :type key: str
+        :param image: the decoded icon image, null if decoding failed
+        :type image: QImage
+        """
+
+        self._pendingIcons.pop(key, None)
+
+        # QPixmap has to be built on the ui thread
+        icon = QIcon(QPixmap.fromImage(image)) if not image.isNull() else QIcon()
+
+        if not hasattr(self, "listWidget"):
+            return
+
+        listWidget = self.listWidget
+        failed = icon.isNull()
+
+        for i in range(listWidget.count()):
+            item = listWidget.item(i)
+
+            if item and item.data(ICON_PATH_ROLE) == key:
+                if failed:
+                    # nothing to show, stop reserving icon space for this row
+                    item.setData(ICON_PATH_ROLE, None)
+                else:
+                    item.setIcon(icon)
+
+        if failed:
+            self._widthDirty = True
+
+        # rows may have grown to fit the icons
+        self._rowHeight = None
+
+        if not self._pendingIcons:
+            self._scheduleRecompute()
 
     def _getSpriteGlobalBounds(self) -> QRect:
         """
@@ -196,19 +318,23 @@ class StartMenuComponent(InterfaceComponent, SpriteAnchorMixin):
         titleWidth = self.titleLabel.sizeHint().width()
         maxItemWidth = max(maxItemWidth, titleWidth)
 
+        # loop invariants, fetched once instead of per row
+        listWidget = self.listWidget
+        iconWidth = listWidget.iconSize().width() + 4
+        horizontalAdvance = listWidget.fontMetrics().horizontalAdvance
+
         # measure each list item width
-        for i in range(self.listWidget.count()):
-            item = self.listWidget.item(i)
+        for i in range(listWidget.count()):
+            item = listWidget.item(i)
             if item:
-                # account for icon if present
-                iconWidth = self.listWidget.iconSize().width() + 4 if not item.icon().isNull() else 0
-                
-                # measure text width
-                metrics = self.listWidget.fontMetrics()
-                textWidth = metrics.horizontalAdvance(item.text())
-                
-                itemWidth = iconWidth + textWidth
-                maxItemWidth = max(maxItemWidth, itemWidth)
+                # account for icon if present, it may still be loading
+                itemWidth = horizontalAdvance(item.text())
+
+                if item.data(ICON_PATH_ROLE):
+                    itemWidth += iconWidth
+
+                if itemWidth > maxItemWidth:
+                    maxItemWidth = itemWidth
 
         # add padding and margins
         chromeWidth = (PADDING * 4) + 16  # padding + some margin for scrollbar/borders
@@ -218,6 +344,7 @@ class StartMenuComponent(InterfaceComponent, SpriteAnchorMixin):
         finalWidth = max(128, min(SIZE_CONSTRAINTS[0], optimalWidth))
         
         self.setFixedWidth(finalWidth)
+        self._widthDirty = False
 
     def _recomputeHeight(self) -> None:
         """
@@ -227,17 +354,17 @@ class StartMenuComponent(InterfaceComponent, SpriteAnchorMixin):
         if not hasattr(self, "listWidget"):
             return
 
-        self.listWidget.doItemsLayout()
         listCount = self.listWidget.count()
 
         rowsTotalHeight = 0
 
         if listCount > 0:
-            for i in range(listCount):
-                h = self.listWidget.sizeHintForRow(i)
+            # every row shares the font and icon size, so one measurement covers them all
+            if self._rowHeight is None:
+                self.listWidget.doItemsLayout()
+                self._rowHeight = max(0, self.listWidget.sizeHintForRow(0))
 
-                if h > 0:
-                    rowsTotalHeight += h
+            rowsTotalHeight = self._rowHeight * listCount
 
             rowsTotalHeight += self.listWidget.spacing() * max(0, listCount - 1)
 
@@ -288,16 +415,14 @@ class StartMenuComponent(InterfaceComponent, SpriteAnchorMixin):
         if not item.flags():
             return
 
-        actionName = item.data(Qt.UserRole)
+        action = self._actionByName.get(item.data(Qt.UserRole))
         self._resetListVisualState()
 
-        for action in self.actions:
-            if action.name != actionName:
-                continue
+        if action is None:
+            return
 
-            self.close()
-            action.callback()
-            break
+        self.close()
+        action.callback()
 
     def _reposition(self):
         """
@@ -323,17 +448,27 @@ class StartMenuComponent(InterfaceComponent, SpriteAnchorMixin):
         :rtype: bool
         """
 
+        # cheapest rejection first, the type is read only once
+        eventType = event.type()
+
+        if (eventType != QEvent.MouseButtonPress) and (eventType != QEvent.ApplicationDeactivate):
+            return False
+
         if (not self.isVisible()) or (not self.sprite):
             return False
 
-        if event.type() == QEvent.ApplicationDeactivate:
+        if eventType == QEvent.ApplicationDeactivate:
             self.close()
             return False
 
-        if event.type() != QEvent.MouseButtonPress:
+        globalPos = event.globalPos()
+
+        # nothing of ours lives outside these two rects, skip the hit-test walk
+        if not (self.frameGeometry().contains(globalPos) or self._getSpriteGlobalBounds().contains(globalPos)):
+            self.close()
             return False
 
-        globalPos = event.globalPos()
+        # another top-level, like the speech bubble, may sit over either rect
         widget = QApplication.widgetAt(globalPos)
 
         if widget is None:
@@ -351,7 +486,7 @@ class StartMenuComponent(InterfaceComponent, SpriteAnchorMixin):
 
     def _recomputeHeightSnap(self) -> None:
         """
-        recompute height and width without animation (snap to final size).
+        recompute height, and width if it has not been measured yet, without animation (snap to final size).
         """
 
         if not self.isVisible():
@@ -361,11 +496,21 @@ class StartMenuComponent(InterfaceComponent, SpriteAnchorMixin):
         self.enableMoveAnimation = False
 
         try:
-            self._recomputeWidth()
+            if self._widthDirty:
+                self._recomputeWidth()
+
             self._recomputeHeight()
         finally:
             self.enableMoveAnimation = previous
 
+    def _scheduleRecompute(self) -> None:
+        """
+        queue a snapped size recompute, folding repeated requests into one.
+        """
+
+        if not self._recomputeTimer.isActive():
+            self._recomputeTimer.start()
+
     def open(self) -> None:
         """
         open the menu if allowed by canOpen check.
@@ -375,8 +520,8 @@ class StartMenuComponent(InterfaceComponent, SpriteAnchorMixin):
             return
 
         super().open()
-        QApplication.instance().installEventFilter(self)
-        QTimer.singleShot(0, self._recomputeHeightSnap)
+        sharedClickAwayFilter().register(self)
+        self._scheduleRecompute()
 
     def hideEvent(self, event) -> None:
         """
@@ -388,7 +533,7 @@ class StartMenuComponent(InterfaceComponent, SpriteAnchorMixin):
         self._resetListVisualState()
 
         try:
-            QApplication.instance().removeEventFilter(self)
+            sharedClickAwayFilter().unregister(self)
         finally:
             super().hideEvent(event)
 
@@ -1,3 +1,4 @@
+from ..base.clickaway import sharedClickAwayFilter
 from ..base.anchor import SpriteAnchorMixin
 from ..base import InterfaceComponent
 
@@ -22,7 +23,7 @@ from ..base.styling import (
 from ...system.sound import SoundCategory, SoundManager
 from ...config import ConfigController
 
-from PySide6.QtCore import Qt, QEvent, QTimer
+from PySide6.QtCore import Qt, QEvent, QSignalBlocker, QTimer
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QApplication,
@@ -33,6 +34,46 @@ from PySide6.QtWidgets import (
 
 from typing import Callable, Iterable, Optional
 
+# sound categories with their own slider, in display order
+VOLUME_CATEGORIES = (
+    SoundCategory.EVENT,
+    SoundCategory.FEEDBACK,
+    SoundCategory.AMBIENT,
+    SoundCategory.SPECIAL,
+    SoundCategory.SPEECH,
+)
+
+# the volume window's stylesheet only depends on constants, so build it once
+VOLUME_QSS = f"""
+    QLabel#volumeTitle {{
+        color: {asRGB(TEXT_COLOR)};
+        padding: 0px;
+    }}
+
+    QSlider::groove:horizontal {{
+        height: {PADDING // 2}px;
+        background: rgba(0, 0, 0, 25);
+        border-radius: 3px;
+    }}
+
+    QSlider::sub-page:horizontal {{
+        background: rgba({TEXT_COLOR.red()}, {TEXT_COLOR.green()}, {TEXT_COLOR.blue()}, 120);
+        border-radius: 3px;
+    }}
+
+    QSlider::handle:horizontal {{
+        width: 14px;
+        margin: -5px 0px;
+        border-radius: 7px;
+        background: rgba(255, 255, 255, 200);
+        border: 1px solid rgba(0, 0, 0, 40);
+    }}
+
+    QSlider::handle:horizontal:hover {{
+        background: {asRGB(QColor(BACKGROUND_COLOR).darker(106))};
+    }}
+"""
+
 def clamp(value: float) -> float:
     return max(0.0, min(1.0, float(value)))
 
@@ -134,13 +175,7 @@ class VolumeWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         rootLayout.addWidget(rootRow)
         rootLayout.addWidget(Divider())
 
-        for cat in (
-            SoundCategory.EVENT,
-            SoundCategory.FEEDBACK,
-            SoundCategory.AMBIENT,
-            SoundCategory.SPECIAL,
-            SoundCategory.SPEECH,
-        ):
+        for cat in VOLUME_CATEGORIES:
             catRow, catSlider, catLabel = buildSliderRow(
                 cat.name.title(),
                 min_val=0,
@@ -153,39 +188,7 @@ class VolumeWindowComponent(InterfaceComponent, SpriteAnchorMixin):
             rootLayout.addWidget(catRow)
 
         # style
-        onHoverBackground = QColor(BACKGROUND_COLOR).darker(106)
-        applyRockStyle(
-            self,
-            extraQss=f"""
-            QLabel#volumeTitle {{
-                color: {asRGB(TEXT_COLOR)};
-                padding: 0px;
-            }}
-
-            QSlider::groove:horizontal {{
-                height: {PADDING // 2}px;
-                background: rgba(0, 0, 0, 25);
-                border-radius: 3px;
-            }}
-
-            QSlider::sub-page:horizontal {{
-                background: rgba({TEXT_COLOR.red()}, {TEXT_COLOR.green()}, {TEXT_COLOR.blue()}, 120);
-                border-radius: 3px;
-            }}
-
-            QSlider::handle:horizontal {{
-                width: 14px;
-                margin: -5px 0px;
-                border-radius: 7px;
-                background: rgba(255, 255, 255, 200);
-                border: 1px solid rgba(0, 0, 0, 40);
-            }}
-
-            QSlider::handle:horizontal:hover {{
-                background: {asRGB(onHoverBackground)};
-            }}
-            """,
-        )
+        applyRockStyle(self, extraQss=VOLUME_QSS)
 
         self._syncFromConfig()
 
@@ -199,7 +202,8 @@ class VolumeWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         :type value01: float
         """
 
-        value01 = clamp(value01)
+        # slider values are already floats, clamp inline instead of through the helper
+        value01 = 0.0 if value01 < 0.0 else (1.0 if value01 > 1.0 else value01)
 
         # UI label
         _slider, label = self._rows.get(key, (None, None))
@@ -233,7 +237,7 @@ class VolumeWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         """
 
         try:
-            self.config.saveConfig()
+            self.config.saveConfigAsync()
         except Exception:
             pass
 
@@ -248,14 +252,7 @@ class VolumeWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         except Exception:
             master = 0.5
 
-        slider, label = self._rows.get("master", (None, None))
-
-        if slider is not None:
-            slider.blockSignals(True)
-            slider.setValue(int(round(master * 100)))
-            slider.blockSignals(False)
-        if label is not None:
-            label.setText(f"{int(round(master * 100))}%")
+        self._syncRow("master", master)
 
         # categories
         try:
@@ -263,29 +260,38 @@ class VolumeWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         except Exception:
             categoryVolumes = {}
 
-        for cat in (
-            SoundCategory.EVENT,
-            SoundCategory.FEEDBACK,
-            SoundCategory.AMBIENT,
-            SoundCategory.SPECIAL,
-            SoundCategory.SPEECH,
-        ):
+        for cat in VOLUME_CATEGORIES:
             volume = clamp(
                 categoryVolumes.get(
                     cat.name, self.soundManager.soundCategories[cat].volume
                 )
             )
 
-            slider, label = self._rows.get(cat.name, (None, None))
+            self._syncRow(cat.name, volume)
+
+    def _syncRow(self, key: str, value01: float) -> None:
+        """
+        show a volume on its slider row, only touching widgets whose value differs.
+        
+        :param key: Configuration key (master or category name)
+        :type key: str
+        :param value01: Volume value between 0.0 and 1.0
+        :type value01: float
+        """
+
+        slider, label = self._rows.get(key, (None, None))
+        percent = int(round(value01 * 100))
+
+        if (slider is not None) and (slider.value() != percent):
+            with QSignalBlocker(slider):
+                slider.setValue(percent)
+
+        if label is not None:
+            text = f"{percent}%"
+
+            if label.text() != text:
+                label.setText(text)
 
-            if slider is not None:
-                slider.blockSignals(True)
-                slider.setValue(int(round(volume * 100)))
-                slider.blockSignals(False)
-            
-            if label is not None:
-                label.setText(f"{int(round(volume * 100))}%")
-                
     def _reposition(self):
         """
         reposition the window relative to the sprite.
@@ -310,17 +316,27 @@ class VolumeWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         :rtype: bool
         """
 
+        # cheapest rejection first, the type is read only once
+        eventType = event.type()
+
+        if (eventType != QEvent.MouseButtonPress) and (eventType != QEvent.ApplicationDeactivate):
+            return False
+
         if (not self.isVisible()) or (not self.sprite):
             return False
 
-        if event.type() == QEvent.ApplicationDeactivate:
+        if eventType == QEvent.ApplicationDeactivate:
             self.close()
             return False
 
-        if event.type() != QEvent.MouseButtonPress:
+        globalPos = event.globalPos()
+
+        # nothing of ours lives outside these two rects, skip the hit-test walk
+        if not (self.frameGeometry().contains(globalPos) or self.spriteFrameGeometry().contains(globalPos)):
+            self.close()
             return False
 
-        globalPos = event.globalPos()
+        # another top-level, like the speech bubble, may sit over either rect
         widget = QApplication.widgetAt(globalPos)
 
         if widget is None:
@@ -343,7 +359,7 @@ class VolumeWindowComponent(InterfaceComponent, SpriteAnchorMixin):
 
         super().open()
         self._syncFromConfig()
-        QApplication.instance().installEventFilter(self)
+        sharedClickAwayFilter().register(self)
 
     def hideEvent(self, event) -> None:
         """
@@ -353,6 +369,6 @@ class VolumeWindowComponent(InterfaceComponent, SpriteAnchorMixin):
         """
 
         try:
-            QApplication.instance().removeEventFilter(self)
+            sharedClickAwayFilter().unregister(self)
         finally:
             super().hideEvent(event)
@@ -1,17 +1,26 @@
 from .config import ConfigController
 
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
+
 from dataclasses import dataclass
-from typing import Optional
+from functools import partial
+from typing import Callable, Optional
 
+import threading
 import requests
+import logging
+import numpy
 import random
 import time
 
+logger = logging.getLogger(__name__)
+
 IP_API = "http://ip-api.com/json/"
 OPEN_METEO = "https://api.open-meteo.com/v1/forecast"
 
 IP_LOCATION_CUTOFF_SECONDS = (60 * 60 * 24) # 24 hours
 CACHE_CUTOFF_WEATHER_SECONDS = (60 * 60) # 1 hour
+REQUEST_TIMEOUT_SECONDS = 10
 
 TIME_DESCRIPTIONS = {
     (0, 0): ["midnight", "the witching hour"],
@@ -25,6 +34,18 @@ TIME_DESCRIPTIONS = {
     (20, 23): ["night", "nighttime", "evening"]
 }
 
+def _buildHourTable() -> list[list[str]]:
+    hourTable = [["today"] for _ in range(24)]
+
+    for (startHour, endHour), descriptions in TIME_DESCRIPTIONS.items():
+        for hour in range(startHour, endHour + 1):
+            hourTable[hour] = descriptions
+
+    return hourTable
+
+# hour of day -> descriptions, flattened from TIME_DESCRIPTIONS once
+HOUR_TABLE = _buildHourTable()
+
 UNITS = [
     # temperature, precipitation, visibility
     ["C", "millimetres", "kilometres"], # metric
@@ -92,6 +113,19 @@ temperatureAsFarenheit: float = lambda temperatureC: (temperatureC * 9/5) + 32
 precipitationAsInches: float = lambda precipitationMm: precipitationMm / 25.4
 visibilityAsMiles: float = lambda visibilityKm: visibilityKm / 1.60934
 
+def isoToUnix(isoTimestamp: str) -> int:
+    """
+    converts a local "YYYY-MM-DDTHH:MM" timestamp to a unix timestamp
+
+    :param isoTimestamp: the local iso timestamp
+    :type isoTimestamp: str
+
+    :return: the unix timestamp
+    :rtype: int
+    """
+
+    return int(time.mktime(time.strptime(isoTimestamp, "%Y-%m-%dT%H:%M")))
+
 class LocationServices:
     """
     manages application permissions and related functionality
@@ -106,6 +140,13 @@ class LocationServices:
 
         self.config = configController
 
+        # one keep-alive session, requests may come from the thread pool too
+        self.session = requests.Session()
+        self.sessionLock = threading.Lock()
+
+        # background weather lookups still running
+        self._runningTasks: set[_WeatherTask] = set()
+
     def getFriendlyLocalTime(self) -> str:
         """
         gets a friendly representation of the current local time
@@ -114,14 +155,7 @@ class LocationServices:
         :rtype: str
         """
 
-        localTime = time.localtime()
-        hour = localTime.tm_hour
-
-        for hourRange, descriptions in TIME_DESCRIPTIONS.items():
-            if hourRange[0] <= hour <= hourRange[1]:
-                return random.choice(descriptions)
-            
-        return "today"
+        return random.choice(HOUR_TABLE[time.localtime().tm_hour])
 
     def locationPermissionAllowed(self) -> bool:
         """
@@ -133,43 +167,63 @@ class LocationServices:
 
         return (self.config.getValue("location.allowedGeoIpFetch") == True)
 
-    def getLocation(self) -> Optional[Location]:
+    def _cachedLocation(self) -> Optional[Location]:
         """
-        gets an inaccurate location using ip geolocation
+        gets the cached ip location if it was fetched recently enough
 
-        :return: the inaccurate location or None if unavailable
+        :return: the cached location or None if missing or expired
         :rtype: Optional[Location]
         """
-        if not self.locationPermissionAllowed():
-            return None
-        
-        lastFetchTimestamp = self.config.getValue("location.ipStats.lastUpdated")
 
-        currentTimestamp = time.time()
+        lastFetchTimestamp = self.config.getValue("location.ipStats.lastUpdated")
 
         if (
-            lastFetchTimestamp is not None
-            and (currentTimestamp - lastFetchTimestamp) < IP_LOCATION_CUTOFF_SECONDS
+            lastFetchTimestamp is None
+            or (time.time() - lastFetchTimestamp) >= IP_LOCATION_CUTOFF_SECONDS
         ):
-            cachedCity = self.config.getValue("location.ipStats.city")
-            cachedCountry = self.config.getValue("location.ipStats.country")
-            cachedLat = self.config.getValue("location.ipStats.lat")
-            cachedLon = self.config.getValue("location.ipStats.lon")
+            return None
 
-            hasCoordinates = (cachedLat is not None) and (cachedLon is not None)
+        cachedCity = self.config.getValue("location.ipStats.city")
+        cachedCountry = self.config.getValue("location.ipStats.country")
+        cachedLat = self.config.getValue("location.ipStats.lat")
+        cachedLon = self.config.getValue("location.ipStats.lon")
 
-            return Location(
-                city=cachedCity,
-                country=cachedCountry,
-                lat_lon=(cachedLat, cachedLon) if hasCoordinates else None
-            )
+        hasCoordinates = (cachedLat is not None) and (cachedLon is not None)
+
+        return Location(
+            city=cachedCity,
+            country=cachedCountry,
+            lat_lon=(cachedLat, cachedLon) if hasCoordinates else None
+        )
 
-        ipResponse = requests.get(IP_API, timeout=10)
+    def _requestIpLocation(self) -> Optional[dict]:
+        """
+        requests the ip geolocation, safe to call off the ui thread
+
+        :return: the decoded response or None if the request failed
+        :rtype: Optional[dict]
+        """
+
+        with self.sessionLock:
+            ipResponse = self.session.get(IP_API, timeout=REQUEST_TIMEOUT_SECONDS)
 
         if not ipResponse.ok:
             return None
-        
-        ipData = ipResponse.json()
+
+        return ipResponse.json()
+
+    def _storeIpLocation(self, ipData: dict, timestamp: float) -> Location:
+        """
+        caches an ip geolocation response in configuration
+
+        :param ipData: the decoded ip geolocation response
+        :type ipData: dict
+        :param timestamp: the unix time the request was made
+        :type timestamp: float
+
+        :return: the location described by the response
+        :rtype: Location
+        """
 
         latitude = ipData.get("lat")
         longitude = ipData.get("lon")
@@ -186,7 +240,7 @@ class LocationServices:
         # update cached location info
         self.config.bulkSetValues(
             {
-                "lastUpdated": currentTimestamp,
+                "lastUpdated": timestamp,
                 "city": locationObject.city,
                 "country": locationObject.country,
                 "lat": latitude,
@@ -197,128 +251,168 @@ class LocationServices:
 
         return locationObject
 
-    def getWeatherData(self, location: Location = None) -> Optional[WeatherData]:
+    def getLocation(self) -> Optional[Location]:
         """
-        gets weather data for the given location if permission is granted
-        AND if weather data has not been recently fetched
+        gets an inaccurate location using ip geolocation
 
-        cached weather data is stored in configuration, and will be returned
-        if it is still valid
+        :return: the inaccurate location or None if unavailable
+        :rtype: Optional[Location]
+        """
+        if not self.locationPermissionAllowed():
+            return None
 
-        :param location: the location to get weather data for
-        :type location: Location
+        cachedLocation = self._cachedLocation()
+
+        if cachedLocation is not None:
+            return cachedLocation
+
+        currentTimestamp = time.time()
+        ipData = self._requestIpLocation()
+
+        if ipData is None:
+            return None
 
-        :return: the weather data or None if unavailable
-        :rtype: Optional[WeatherData]
+        return self._storeIpLocation(ipData, currentTimestamp)
+
+    def _weatherCacheIsFresh(self, cachedWeatherStats: dict) -> bool:
         """
+        checks whether cached weather stats exist and are recent enough to reuse
 
-        if location is None:
-            location = self.getLocation()
-        
-        cachedWeatherStats = self.config.getValue("location.weatherStats") or {}
+        :param cachedWeatherStats: the cached weather stats from configuration
+        :type cachedWeatherStats: dict
+
+        :return: whether the cache can be used without refetching
+        :rtype: bool
+        """
 
-        # cache object
         lastCacheTimestamp = cachedWeatherStats.get("lastUpdated", 0)
-        currentTimestamp = time.time()
 
-        # units system
-        preferMetric = (self.config.getValue("location.preferMetric") == True)
-        unitSet = UNITS[0] if preferMetric else UNITS[1]
+        cacheDoesntExist = (lastCacheTimestamp == 0 or len(cachedWeatherStats.get("timestamps", [])) == 0)
+        cacheIsStale = (time.time() - lastCacheTimestamp) >= CACHE_CUTOFF_WEATHER_SECONDS
+
+        return not (cacheDoesntExist or cacheIsStale)
 
-        # 1) default to cached values (even if stale or empty)
-        timestamps = cachedWeatherStats.get("timestamps", [])
-        temperature = cachedWeatherStats.get("temperature", [])
-        precipitation = cachedWeatherStats.get("precipitation", [])
-        precipitationChance=cachedWeatherStats.get("precipitationChance", [])
-        visibility = cachedWeatherStats.get("visibility", [])
+    def _requestHourlyWeather(self, latLon: tuple[float, float]) -> Optional[dict]:
+        """
+        requests today's hourly forecast, safe to call off the ui thread
 
-        # 2) revalidate only if cache is stale, or doesnt exist
-        cacheDoesntExist = (lastCacheTimestamp == 0 or len(timestamps) == 0)
-        cacheIsStale =  (currentTimestamp - lastCacheTimestamp) >= CACHE_CUTOFF_WEATHER_SECONDS
+        :param latLon: the latitude and longitude to get the forecast for
+        :type latLon: tuple[float, float]
+
+        :return: the hourly forecast block or None if the request failed
+        :rtype: Optional[dict]
+        """
 
-        if cacheDoesntExist or cacheIsStale:
-            # 2.1) collect new data
-            weatherResponse = requests.get(
+        with self.sessionLock:
+            weatherResponse = self.session.get(
                 OPEN_METEO,
                 params={
-                    "latitude": location.lat_lon[0],
-                    "longitude": location.lat_lon[1],
+                    "latitude": latLon[0],
+                    "longitude": latLon[1],
                     "hourly": "temperature_2m,precipitation,precipitation_probability,visibility",
                     "timezone": "auto",
                     "forecast_days": 1
-                }
-            )
-
-            # 2.2) failed to get weather data
-            if not weatherResponse.ok:
-                return None
-
-            weatherData = weatherResponse.json().get("hourly")
-
-            if weatherData is None:
-                return None
-            
-            # 2.3) convert timestamps to unix
-            unixTimestamps = []
-
-            for isoTimestamp in weatherData.get("time", []):
-                structTime = time.strptime(isoTimestamp, "%Y-%m-%dT%H:%M")
-                unixTimestamps.append(int(time.mktime(structTime)))
-
-            # 2.4) convert metres to kilometres
-            visibilityKm = []
-            for visMetres in weatherData.get("visibility", []):
-                visibilityKm.append(visMetres / 1000.0)
-
-            timestamps: list[int] = unixTimestamps
-            temperature: list[float] = weatherData.get("temperature_2m", [])
-            precipitation: list[float] = weatherData.get("precipitation", [])
-            precipitationChance: list[float] = weatherData.get("precipitation_probability", [])
-            visibility: list[float] = visibilityKm
-
-            # 2.5) update cached weather stats
-            self.config.bulkSetValues(
-                {
-                    "lastUpdated": currentTimestamp,
-                    "timestamps": timestamps,
-                    "temperature": temperature,
-                    "precipitation": precipitation,
-                    "precipitationChance": precipitationChance,
-                    "visibility": visibility
                 },
-                parentPath="location.weatherStats"
+                timeout=REQUEST_TIMEOUT_SECONDS
             )
 
-        # 3) convert to imperial if needed
-        if not preferMetric:
-            convertedTemperature = []
-            convertedPrecipitation = []
-            convertedVisibility = []
+        # failed to get weather data
+        if not weatherResponse.ok:
+            return None
 
-            minLen = min(len(temperature), len(precipitation), len(visibility))
+        return weatherResponse.json().get("hourly")
 
-            for i in range(minLen):
-                tempC = temperature[i]
-                precipMm = precipitation[i]
-                visKm = visibility[i]
+    def _storeWeather(self, weatherData: dict, timestamp: float) -> dict:
+        """
+        converts an hourly forecast block and caches it in configuration
 
-                convertedTemperature.append(
-                    temperatureAsFarenheit(tempC)
-                )
+        :param weatherData: the hourly forecast block
+        :type weatherData: dict
+        :param timestamp: the unix time the request was made
+        :type timestamp: float
 
-                convertedPrecipitation.append(
-                    precipitationAsInches(precipMm)
-                )
+        :return: the cached weather stats
+        :rtype: dict
+        """
 
-                convertedVisibility.append(
-                    visibilityAsMiles(visKm)
-                )
+        # convert timestamps to unix
+        isoTimestamps = weatherData.get("time", [])
+        unixTimestamps = []
+
+        if isoTimestamps:
+            firstTimestamp = isoToUnix(isoTimestamps[0])
+            lastTimestamp = isoToUnix(isoTimestamps[-1])
+
+            # the forecast is whole consecutive hours, so unless a dst change lands
+            # inside it every entry is just an hour after the previous one
+            if (lastTimestamp - firstTimestamp) == (len(isoTimestamps) - 1) * 3600:
+                unixTimestamps = [
+                    firstTimestamp + (index * 3600)
+                    for index in range(len(isoTimestamps))
+                ]
+            else:
+                unixTimestamps = [isoToUnix(isoTimestamp) for isoTimestamp in isoTimestamps]
+
+        # convert metres to kilometres
+        visibilityKm = []
+        for visMetres in weatherData.get("visibility", []):
+            visibilityKm.append(visMetres / 1000.0)
+
+        weatherStats = {
+            "lastUpdated": timestamp,
+            "timestamps": unixTimestamps,
+            "temperature": weatherData.get("temperature_2m", []),
+            "precipitation": weatherData.get("precipitation", []),
+            "precipitationChance": weatherData.get("precipitation_probability", []),
+            "visibility": visibilityKm
+        }
+
+        # update cached weather stats
+        self.config.bulkSetValues(
+            weatherStats,
+            parentPath="location.weatherStats"
+        )
+
+        return weatherStats
+
+    def _assembleWeatherData(self, weatherStats: dict) -> WeatherData:
+        """
+        builds weather data from cached weather stats in the preferred units
+
+        :param weatherStats: the cached weather stats
+        :type weatherStats: dict
+
+        :return: the weather data
+        :rtype: WeatherData
+        """
+
+        # units system
+        preferMetric = (self.config.getValue("location.preferMetric") == True)
+        unitSet = UNITS[0] if preferMetric else UNITS[1]
 
-            temperature = convertedTemperature
-            precipitation = convertedPrecipitation
-            visibility = convertedVisibility
+        timestamps = weatherStats.get("timestamps", [])
+        temperature = weatherStats.get("temperature", [])
+        precipitation = weatherStats.get("precipitation", [])
+        precipitationChance = weatherStats.get("precipitationChance", [])
+        visibility = weatherStats.get("visibility", [])
+
+        # convert to imperial if needed
+        if not preferMetric:
+            minLen = min(len(temperature), len(precipitation), len(visibility))
+
+            # the converters are plain arithmetic, so they apply to whole arrays at once
+            temperature = temperatureAsFarenheit(
+                numpy.asarray(temperature[:minLen], dtype=numpy.float64)
+            ).tolist()
+
+            precipitation = precipitationAsInches(
+                numpy.asarray(precipitation[:minLen], dtype=numpy.float64)
+            ).tolist()
+
+            visibility = visibilityAsMiles(
+                numpy.asarray(visibility[:minLen], dtype=numpy.float64)
+            ).tolist()
 
-        # 4) return assembled weather data
         return WeatherData(
             timestamps=timestamps,
             temperature=temperature,
@@ -331,3 +425,143 @@ class LocationServices:
             precipitationUnit=unitSet[1],
             visibilityUnit=unitSet[2]
         )
+
+    def getWeatherDataAsync(
+        self,
+        onResult: Callable[[Optional[WeatherData]], None],
+        location: Location = None
+    ) -> None:
+        """
+        gets weather data for the given location if permission is granted
+        AND if weather data has not been recently fetched
+
+        cached weather data is stored in configuration, and will be returned
+        if it is still valid. any network requests run on the thread pool
+
+        onResult is always called on the ui thread, straight away when the
+        cached data can be used
+
+        :param onResult: called with the weather data or None if unavailable
+        :type onResult: Callable[[Optional[WeatherData]], None]
+        :param location: the location to get weather data for
+        :type location: Location
+        """
+
+        cachedWeatherStats = self.config.getValue("location.weatherStats") or {}
+
+        if self._weatherCacheIsFresh(cachedWeatherStats):
+            onResult(self._assembleWeatherData(cachedWeatherStats))
+            return
+
+        if location is None:
+            if not self.locationPermissionAllowed():
+                onResult(None)
+                return
+
+            # None here means the task has to look the location up as well
+            location = self._cachedLocation()
+
+            if (location is not None) and (location.lat_lon is None):
+                onResult(None)
+                return
+        elif location.lat_lon is None:
+            onResult(None)
+            return
+
+        task = _WeatherTask(
+            self,
+            location.lat_lon if location is not None else None
+        )
+
+        # keep the task (and its signals object) alive until it reports back,
+        # the pool still deletes the runnable itself once it has run
+        self._runningTasks.add(task)
+
+        task.signals.finished.connect(
+            partial(self._onWeatherFetched, task, onResult),
+            Qt.QueuedConnection
+        )
+
+        QThreadPool.globalInstance().start(task)
+
+    def _onWeatherFetched(
+        self,
+        task: "_WeatherTask",
+        onResult: Callable[[Optional[WeatherData]], None],
+        ipData: Optional[dict],
+        weatherData: Optional[dict]
+    ) -> None:
+        """
+        caches the responses of a background weather lookup and reports the result
+
+        :param task: the finished task
+        :type task: _WeatherTask
+        :param onResult: the callback passed to getWeatherDataAsync
+        :type onResult: Callable[[Optional[WeatherData]], None]
+        :param ipData: the ip geolocation response, if one was requested
+        :type ipData: Optional[dict]
+        :param weatherData: the hourly forecast block, or None if unavailable
+        :type weatherData: Optional[dict]
+        """
+
+        self._runningTasks.discard(task)
+        task.signals.finished.disconnect()
+
+        result = None
+
+        # onResult has to run whatever happens here, the caller is waiting on it
+        try:
+            if ipData is not None:
+                self._storeIpLocation(ipData, task.startedAt)
+
+            if weatherData is not None:
+                result = self._assembleWeatherData(
+                    self._storeWeather(weatherData, task.startedAt)
+                )
+        except Exception as e:
+            logger.warning(f"Failed to store fetched weather data: {e}")
+            result = None
+
+        onResult(result)
+
+class _WeatherTaskSignals(QObject):
+    finished = Signal(object, object)
+
+class _WeatherTask(QRunnable):
+    """
+    runs the network half of a weather lookup on the thread pool, the
+    responses are handed back to the ui thread through a queued signal
+    """
+
+    def __init__(
+        self,
+        services: LocationServices,
+        latLon: Optional[tuple[float, float]]
+    ):
+        super().__init__()
+
+        self.services = services
+        self.latLon = latLon
+        self.startedAt = time.time()
+        self.signals = _WeatherTaskSignals()
+
+    def run(self) -> None:
+        ipData = None
+        weatherData = None
+
+        try:
+            latLon = self.latLon
+
+            # no cached location, look it up first
+            if latLon is None:
+                ipData = self.services._requestIpLocation()
+
+                if (ipData is not None) and (ipData.get("lat") is not None) and (ipData.get("lon") is not None):
+                    latLon = (ipData["lat"], ipData["lon"])
+
+            if latLon is not None:
+                weatherData = self.services._requestHourlyWeather(latLon)
+        except Exception:
+            pass
+
+        self.signals.finished.emit(ipData, weatherData)